@@ -4,18 +4,37 @@ Implements decision-making for card selection, bidding, and auction behavior.
 Three difficulty levels with different strategies.
 """
 
+import os
 import random
 import asyncio
+import functools
 import logging
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import List, Dict, Optional, Sequence, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from game import Game, Player
+    from auction import Auction
 
-from cards import ARTISTS, ROUND_END_CARD_COUNT
+from cards import ARTISTS, ARTIST_INDEX, ROUND_END_CARD_COUNT, ROUND_VALUE_BY_RANK
 
 log = logging.getLogger("ai")
 
+# Board counts at which playing one more card nears / ends the round
+_LAST_BEFORE_ROUND_END = ROUND_END_CARD_COUNT - 1
+_NEAR_ROUND_END = ROUND_END_CARD_COUNT - 2
+
+# Card-play score bonus per auction type:
+# fixed price lets us control the price as seller, sealed bids can yield
+# good profits, and a double is only worth it with another card of the
+# same artist (_DOUBLE_PAIR_BONUS offsets the base penalty to +12)
+_TYPE_BONUS = {"fixed_price": 5, "double": -3, "sealed": 3,
+               "open": 0, "once_around": 0}
+_DOUBLE_PAIR_BONUS = 15
+
+# Preference order for the second card of a double (best first)
+_DOUBLE_TYPE_PREFERENCE = ("fixed_price", "open", "once_around", "sealed", "double")
+_DOUBLE_TYPE_RANK = {t: i for i, t in enumerate(_DOUBLE_TYPE_PREFERENCE)}
+
 
 class AIBrain:
     """AI decision-making engine."""
@@ -25,180 +44,142 @@ class AIBrain:
     DIFFICULTY_NORMAL = "normal"
     DIFFICULTY_HARD = "hard"
 
-    def __init__(self, difficulty: str = DIFFICULTY_NORMAL):
+    # Open-auction raise sizes; four entries so two random bits pick one
+    _BID_INCREMENTS = (1000, 2000, 3000, 5000)
+
+    # Fixed price as a fraction of estimated value: (low, span) per difficulty
+    _PRICE_BANDS = {
+        DIFFICULTY_EASY: (0.5, 0.3),
+        DIFFICULTY_NORMAL: (0.6, 0.3),
+        DIFFICULTY_HARD: (0.7, 0.3),
+    }
+
+    # Personality variance: adds randomness to decisions
+    _VARIANCE = {
+        DIFFICULTY_EASY: 0.4,
+        DIFFICULTY_NORMAL: 0.2,
+        DIFFICULTY_HARD: 0.1,
+    }
+
+    # Base bid aggression multiplier
+    _AGGRESSION = {
+        DIFFICULTY_EASY: 0.6,
+        DIFFICULTY_NORMAL: 0.75,
+        DIFFICULTY_HARD: 0.85,
+    }
+
+    def __init__(self, difficulty: str = DIFFICULTY_NORMAL,
+                 seed: Optional[int] = None):
         self.difficulty = difficulty
-        # Personality variance: adds randomness to decisions
-        self._variance = {
-            self.DIFFICULTY_EASY: 0.4,
-            self.DIFFICULTY_NORMAL: 0.2,
-            self.DIFFICULTY_HARD: 0.1,
-        }.get(difficulty, 0.2)
-
-    def choose_card_to_play(self, hand: List[Dict], board: Dict[str, int],
-                            market: Dict[str, int], round_num: int,
+        # Own RNG so simulations can replay a brain from a seed
+        self._rng = random.Random(seed)
+        self._uniform = self._rng.uniform
+        self._random = self._rng.random
+        self._variance = self._VARIANCE.get(difficulty, 0.2)
+        self._score_hand = _card_scorer(self._variance * 20)
+        self._aggression_base = self._AGGRESSION.get(difficulty, 0.75)
+        self._aggression_jitter = 0.1
+
+    def choose_card_to_play(self, hand_artists: Sequence[str],
+                            hand_types: Sequence[str], board: Sequence[int],
+                            market: Sequence[int], round_num: int,
                             num_players: int) -> int:
-        """Choose which card to play from hand. Returns card index."""
-        if not hand:
+        """Choose which card to play from hand. Returns card index.
+
+        The hand is given as parallel artist / auction type sequences
+        (see Player.hand_soa); board and market are indexed by ARTIST_INDEX
+        (see Game.board / Game.market).
+        """
+        if not hand_artists:
             return -1
 
-        scores = []
-        for i, card in enumerate(hand):
-            score = self._evaluate_card_play(card, hand, board, market, round_num)
-            # Add random variance
-            score += random.uniform(-self._variance * 20, self._variance * 20)
-            scores.append((i, score))
-
-        # Sort by score descending
-        scores.sort(key=lambda x: -x[1])
-        return scores[0][0]
-
-    def _evaluate_card_play(self, card: Dict, hand: List[Dict],
-                            board: Dict[str, int], market: Dict[str, int],
-                            round_num: int) -> float:
-        """Score a card for playing. Higher = better to play now."""
-        artist = card["artist"]
-        auction_type = card["auction_type"]
-        board_count = board.get(artist, 0)
-
-        score = 0.0
-
-        # Prefer artists that are already popular (closer to scoring well)
-        score += board_count * 8
-
-        # Prefer artists with existing market value (cumulative bonus)
-        market_val = market.get(artist, 0)
-        if market_val > 0:
-            score += 15
-
-        # Count how many cards of this artist we hold
-        my_artist_count = sum(1 for c in hand if c["artist"] == artist)
-
-        # Prefer playing artists we have many of (we can drive the market)
-        score += my_artist_count * 5
-
-        # Avoid pushing an artist to 5 if we hold many paintings of it
-        # (round would end, possibly before we can benefit)
-        if board_count >= 3 and my_artist_count <= 1:
-            score += 10  # Ending round with an artist we don't hold is fine
-        elif board_count >= 4:
-            score -= 15  # 5th card ends round without auction
-
-        # Auction type preferences
-        if auction_type == "fixed_price":
-            # Fixed price is good when we're the seller - we control the price
-            score += 5
-        elif auction_type == "double":
-            # Double is powerful if we have another card of same artist
-            if my_artist_count >= 2:
-                score += 12
-            else:
-                score -= 3
-        elif auction_type == "sealed":
-            # Sealed bid can yield good profits
-            score += 3
+        scores = self._score_hand([ARTIST_INDEX[a] for a in hand_artists],
+                                  hand_types, board, market, self._uniform)
 
-        return score
+        # Highest score wins (first one on ties)
+        return max(range(len(scores)), key=scores.__getitem__)
 
-    def choose_double_card(self, hand: List[Dict], base_artist: str) -> int:
-        """Choose a second card for double auction. Returns index or -1 to skip."""
-        matching = [(i, c) for i, c in enumerate(hand) if c["artist"] == base_artist]
-        if not matching:
-            return -1
+    def choose_double_card(self, hand_artists: Sequence[str],
+                           hand_types: Sequence[str], base_artist: str,
+                           exclude_index: int = -1) -> int:
+        """Choose a second card for double auction. Returns index or -1 to skip.
 
+        exclude_index skips one card (the double itself when the AI plays it)
+        while keeping the returned index relative to the full hand.
+        """
         # Prefer non-double cards for the second card (their auction type is used)
         # Prefer fixed_price or open for better control
-        preferred_types = ["fixed_price", "open", "once_around", "sealed", "double"]
-        matching.sort(key=lambda x: preferred_types.index(x[1].get("auction_type", "open"))
-                      if x[1].get("auction_type", "open") in preferred_types else 99)
+        best_index = -1
+        best_rank = 0
+        for i, artist in enumerate(hand_artists):
+            if artist != base_artist or i == exclude_index:
+                continue
+            rank = _DOUBLE_TYPE_RANK.get(hand_types[i], 99)
+            if best_index < 0 or rank < best_rank:
+                best_index, best_rank = i, rank
+        if best_index < 0:
+            return -1
 
         if self.difficulty == self.DIFFICULTY_EASY:
             # Easy AI sometimes skips the double
-            if random.random() < 0.3:
+            if self._random() < 0.3:
                 return -1
 
-        return matching[0][0]
+        return best_index
 
     def decide_bid_open(self, card: Dict, current_bid: int, my_money: int,
-                        board: Dict[str, int], market: Dict[str, int],
+                        board: Sequence[int], market: Sequence[int],
                         is_double: bool = False) -> Optional[int]:
         """Decide bid for open auction. Returns bid amount or None to pass."""
-        max_value = self._estimate_card_value(card, board, market, is_double)
-
-        # Determine max willingness to pay
-        willingness = max_value * self._get_aggression_factor()
-
-        # Don't bid more than we have
-        willingness = min(willingness, my_money)
+        willingness = self._willingness(card, board, market, my_money, is_double)
 
         # Must beat current bid
         min_bid = current_bid + 1000
-
         if min_bid > willingness:
             return None  # Pass
 
         # Bid slightly above current
-        bid_increment = random.choice([1000, 2000, 3000, 5000])
         if self.difficulty == self.DIFFICULTY_HARD:
             bid_increment = 1000  # Hard AI bids minimally to save money
+        else:
+            bid_increment = self._BID_INCREMENTS[self._rng.getrandbits(2)]
 
-        bid = current_bid + bid_increment
-        bid = min(bid, int(willingness))
-        bid = max(bid, min_bid)
-        bid = (bid // 1000) * 1000  # Round to 1000
-
-        if bid > my_money:
-            return None
-
-        return bid
+        bid = _clip_and_round(current_bid + bid_increment, min_bid, int(willingness))
+        return bid if bid <= my_money else None
 
     def decide_bid_once_around(self, card: Dict, current_bid: int, my_money: int,
-                                board: Dict[str, int], market: Dict[str, int],
+                                board: Sequence[int], market: Sequence[int],
                                 is_double: bool = False) -> Optional[int]:
         """Decide bid for once-around auction."""
-        max_value = self._estimate_card_value(card, board, market, is_double)
-        willingness = max_value * self._get_aggression_factor()
-        willingness = min(willingness, my_money)
+        willingness = self._willingness(card, board, market, my_money, is_double)
 
         min_bid = max(current_bid + 1000, 1000)
-
         if min_bid > willingness:
             return None
 
         # In once-around, bid higher since you only get one chance
-        bid = int(willingness * random.uniform(0.6, 0.9))
-        bid = max(bid, min_bid)
-        bid = (bid // 1000) * 1000
-
-        if bid > my_money:
-            return None
-
-        return bid
+        bid = _clip_and_round(int(willingness * self._uniform(0.6, 0.9)),
+                              min_bid, int(willingness))
+        return bid if bid <= my_money else None
 
     def decide_bid_sealed(self, card: Dict, my_money: int,
-                          board: Dict[str, int], market: Dict[str, int],
+                          board: Sequence[int], market: Sequence[int],
                           num_players: int,
                           is_double: bool = False) -> int:
         """Decide sealed bid amount."""
-        max_value = self._estimate_card_value(card, board, market, is_double)
-        willingness = max_value * self._get_aggression_factor()
-        willingness = min(willingness, my_money)
+        willingness = self._willingness(card, board, market, my_money, is_double)
 
         if willingness < 1000:
             return 0  # Pass (bid 0)
 
         # Bid a fraction of willingness (unknown what others will bid)
-        bid = int(willingness * random.uniform(0.4, 0.75))
-        bid = max(bid, 1000)
-        bid = (bid // 1000) * 1000
-
-        if bid > my_money:
-            return 0
-
-        return bid
+        bid = _clip_and_round(int(willingness * self._uniform(0.4, 0.75)),
+                              1000, int(willingness))
+        return bid if bid <= my_money else 0
 
     def decide_fixed_price_accept(self, card: Dict, price: int, my_money: int,
-                                   board: Dict[str, int],
-                                   market: Dict[str, int],
+                                   board: Sequence[int],
+                                   market: Sequence[int],
                                    is_double: bool = False) -> bool:
         """Decide whether to accept a fixed price offer."""
         if price > my_money:
@@ -209,64 +190,134 @@ class AIBrain:
 
         return price <= threshold
 
-    def choose_fixed_price(self, card: Dict, board: Dict[str, int],
-                           market: Dict[str, int],
+    def choose_fixed_price(self, card: Dict, board: Sequence[int],
+                           market: Sequence[int],
                            is_double: bool = False) -> int:
         """Choose a fixed price as seller."""
         max_value = self._estimate_card_value(card, board, market, is_double)
 
         # Set price slightly above estimated value to profit
-        if self.difficulty == self.DIFFICULTY_EASY:
-            price = int(max_value * random.uniform(0.5, 0.8))
-        elif self.difficulty == self.DIFFICULTY_HARD:
-            price = int(max_value * random.uniform(0.7, 1.0))
-        else:
-            price = int(max_value * random.uniform(0.6, 0.9))
+        low, span = self._PRICE_BANDS.get(self.difficulty,
+                                          self._PRICE_BANDS[self.DIFFICULTY_NORMAL])
+        price = int(max_value * (low + self._random() * span))
 
         price = max(price, 1000)
         price = (price // 1000) * 1000
         return price
 
-    def _estimate_card_value(self, card: Dict, board: Dict[str, int],
-                             market: Dict[str, int],
+    def _estimate_card_value(self, card: Dict, board: Sequence[int],
+                             market: Sequence[int],
                              is_double: bool = False) -> float:
         """Estimate the monetary value of a painting card."""
         artist = card["artist"]
-        board_count = board.get(artist, 0)
-        current_market = market.get(artist, 0)
+        return _estimate_value_cached(artist, tuple(board),
+                                      market[ARTIST_INDEX[artist]], is_double)
 
-        # Predict this round's value contribution
-        # Estimate where this artist will rank
-        all_counts = [(a, board.get(a, 0)) for a in ARTISTS]
-        # Add the card being auctioned
-        simulated = dict(all_counts)
-        simulated[artist] = board_count + (2 if is_double else 1)
+    def _willingness(self, card: Dict, board: Sequence[int],
+                     market: Sequence[int], my_money: int,
+                     is_double: bool = False) -> float:
+        """Most we are willing to pay for the card, capped by our money."""
+        max_value = self._estimate_card_value(card, board, market, is_double)
+        return min(max_value * self._get_aggression_factor(), my_money)
 
-        # Sort by count
-        sorted_artists = sorted(simulated.items(), key=lambda x: -x[1])
-        rank = next((i for i, (a, _) in enumerate(sorted_artists) if a == artist), 4)
+    def _get_aggression_factor(self) -> float:
+        """Get bid aggression multiplier based on difficulty."""
+        return self._aggression_base + self._uniform(-self._aggression_jitter,
+                                                      self._aggression_jitter)
+
+
+def _clip_and_round(bid: int, floor: int, ceiling: int) -> int:
+    """Clamp a bid into [floor, ceiling] and round down to a multiple of 1000."""
+    return max(floor, min(bid, ceiling)) // 1000 * 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _card_scorer(spread: float):
+    """Build the card-play scorer for one variance spread.
+
+    The returned function scores every card in hand (higher = better to play
+    now) and adds a uniform jitter in [-spread, spread] per card. Tables and
+    thresholds are bound as locals; one scorer is shared by every brain of
+    the same difficulty.
+    """
+    n_artists = len(ARTISTS)
+    near_end = _NEAR_ROUND_END
+    last_before_end = _LAST_BEFORE_ROUND_END
+    type_bonus = _TYPE_BONUS.get
+    pair_bonus = _DOUBLE_PAIR_BONUS
+    low = -spread
+
+    def score_hand(hand_artists: List[int], hand_types: Sequence[str],
+                   board_counts: Sequence[int], market_vals: Sequence[int],
+                   uniform) -> List[float]:
+        """hand_artists holds artist indices (see ARTIST_INDEX); board_counts
+        and market_vals are indexed the same way."""
+        artist_counts = [0] * n_artists
+        for a in hand_artists:
+            artist_counts[a] += 1
 
-        round_value = {0: 30000, 1: 20000, 2: 10000}.get(rank, 0)
+        scores = []
+        for a, auction_type in zip(hand_artists, hand_types):
+            board_count = board_counts[a]
+            my_artist_count = artist_counts[a]
 
-        # Total expected value = current market + predicted round value
-        expected_value = current_market + round_value
+            # Prefer artists that are already popular (closer to scoring
+            # well) and artists we have many of (we can drive the market)
+            score = float(board_count * 8 + my_artist_count * 5)
 
-        # Discount for uncertainty
-        if board_count <= 1:
-            expected_value *= 0.5  # Early in round, uncertain
-        elif board_count >= 3:
-            expected_value *= 0.85  # Fairly certain of ranking
+            # Prefer artists with existing market value (cumulative bonus)
+            if market_vals[a] > 0:
+                score += 15
 
-        return expected_value
+            # Avoid pushing an artist to the round end if we hold many
+            # paintings of it (round would end, possibly before we can benefit)
+            if board_count >= near_end and my_artist_count <= 1:
+                score += 10  # Ending round with an artist we don't hold is fine
+            elif board_count >= last_before_end:
+                score -= 15  # Next card ends round without auction
 
-    def _get_aggression_factor(self) -> float:
-        """Get bid aggression multiplier based on difficulty."""
-        base = {
-            self.DIFFICULTY_EASY: 0.6,
-            self.DIFFICULTY_NORMAL: 0.75,
-            self.DIFFICULTY_HARD: 0.85,
-        }.get(self.difficulty, 0.75)
-        return base + random.uniform(-0.1, 0.1)
+            # Auction type preferences
+            score += type_bonus(auction_type, 0)
+            if auction_type == "double" and my_artist_count >= 2:
+                score += pair_bonus
+
+            # Random variance
+            scores.append(score + uniform(low, spread))
+        return scores
+
+    return score_hand
+
+
+@functools.lru_cache(maxsize=512)
+def _estimate_value_cached(artist: str, board_key: tuple, current_market: int,
+                           is_double: bool) -> float:
+    """Pure value estimate behind AIBrain._estimate_card_value.
+
+    board_key holds the board counts in ARTISTS order, so identical board
+    states seen during a think phase (or by other AIs) hit the cache.
+    """
+    idx = ARTIST_INDEX[artist]
+    board_count = board_key[idx]
+
+    # Predict this round's value contribution
+    # Estimate where this artist will rank once the auctioned card is added:
+    # count the artists ahead of it (ties go to the earlier artist)
+    bumped = board_count + (2 if is_double else 1)
+    rank = sum(1 for j, c in enumerate(board_key)
+               if c > bumped or (c == bumped and j < idx))
+
+    round_value = ROUND_VALUE_BY_RANK[rank]
+
+    # Total expected value = current market + predicted round value
+    expected_value = current_market + round_value
+
+    # Discount for uncertainty
+    if board_count <= 1:
+        expected_value *= 0.5  # Early in round, uncertain
+    elif board_count >= 3:
+        expected_value *= 0.85  # Fairly certain of ranking
+
+    return expected_value
 
 
 class AIPlayerController:
@@ -280,21 +331,34 @@ class AIPlayerController:
 
     AI_TIMEOUT = 5.0  # Timeout per AI action in seconds
 
-    def __init__(self, difficulty: str = AIBrain.DIFFICULTY_NORMAL):
-        self.brain = AIBrain(difficulty)
+    # Multiplier for AI "thinking" pauses. AI_NOSLEEP=1 turns them off for
+    # headless runs (e.g. bulk AI-vs-AI simulation).
+    THINK_DELAY_SCALE = 0.0 if os.environ.get("AI_NOSLEEP") else 1.0
+
+    def __init__(self, difficulty: str = AIBrain.DIFFICULTY_NORMAL,
+                 seed: Optional[int] = None):
+        self.brain = AIBrain(difficulty, seed)
         self.difficulty = difficulty
-        self._used_names: List[str] = []
+        self.think_delay_scale = self.THINK_DELAY_SCALE
+        self._used_names: Set[str] = set()
 
     def get_ai_name(self) -> str:
         """Get a unique AI player name."""
+        # Filter the ordered list (not a set difference) so a seeded run
+        # picks the same names every time
         available = [n for n in self.AI_NAMES if n not in self._used_names]
         if not available:
             name = f"AI_{random.randint(100, 999)}"
         else:
             name = random.choice(available)
-        self._used_names.append(name)
+        self._used_names.add(name)
         return name
 
+    async def _think_delay(self, low: float, high: float) -> None:
+        """Pause for a human-like thinking time (skipped when scale is 0)."""
+        if self.think_delay_scale > 0:
+            await asyncio.sleep(random.uniform(low, high) * self.think_delay_scale)
+
     async def process_turn(self, game: "Game", player_index: int) -> None:
         """Process an AI player's turn (card selection)."""
         player = game.players[player_index]
@@ -305,17 +369,14 @@ class AIPlayerController:
         log.debug("AI process_turn: P%d %s thinking... (hand=%d cards)",
                   player_index, player.name, len(player.hand))
 
-        card_index = 0
-        double_index = -1
-
-        try:
-            card_index, double_index = await asyncio.wait_for(
-                self._think_card(game, player_index), timeout=self.AI_TIMEOUT
-            )
-        except asyncio.TimeoutError:
+        deadline = asyncio.get_running_loop().time() + self.AI_TIMEOUT
+        choice = await self._think_card(game, player_index, deadline)
+        if choice is None:
             log.warning("AI TIMEOUT: P%d %s - playing random card", player_index, player.name)
             card_index = random.randint(0, len(player.hand) - 1)
             double_index = -1
+        else:
+            card_index, double_index = choice
 
         log.debug("AI process_turn: P%d %s chose card=%s(%s) double=%d",
                   player_index, player.name,
@@ -324,14 +385,18 @@ class AIPlayerController:
                   double_index)
         await game.handle_play_card(player_index, card_index, double_index)
 
-    async def _think_card(self, game: "Game", player_index: int) -> tuple:
-        """Think phase for card selection (can be timed out safely)."""
+    async def _think_card(self, game: "Game", player_index: int,
+                          deadline: float) -> Optional[tuple]:
+        """Think phase for card selection. Returns None past the deadline."""
         player = game.players[player_index]
-        await asyncio.sleep(random.uniform(1.0, 2.5))
+        await self._think_delay(1.0, 2.5)
+        if asyncio.get_running_loop().time() > deadline:
+            return None
 
-        hand_dicts = [c.to_dict() for c in player.hand]
+        hand_artists, hand_types = player.hand_soa()
         card_index = self.brain.choose_card_to_play(
-            hand_dicts, game.board, game.market, game.round_num, game.num_players
+            hand_artists, hand_types, game.board, game.market,
+            game.round_num, game.num_players
         )
 
         if card_index < 0:
@@ -341,21 +406,9 @@ class AIPlayerController:
         double_index = -1
 
         if card.auction_type == "double":
-            matching = [
-                i for i, c in enumerate(player.hand)
-                if c.artist == card.artist and i != card_index
-            ]
-            if matching:
-                hand_without_first = [c.to_dict() for i, c in enumerate(player.hand)
-                                       if i != card_index]
-                double_choice = self.brain.choose_double_card(
-                    hand_without_first, card.artist
-                )
-                if double_choice >= 0:
-                    remaining_indices = [i for i in range(len(player.hand))
-                                          if i != card_index]
-                    if double_choice < len(remaining_indices):
-                        double_index = remaining_indices[double_choice]
+            double_index = self.brain.choose_double_card(
+                hand_artists, hand_types, card.artist, exclude_index=card_index
+            )
 
         return card_index, double_index
 
@@ -363,10 +416,10 @@ class AIPlayerController:
                                        artist: str) -> None:
         """Process AI response to a double request."""
         player = game.players[player_index]
-        await asyncio.sleep(random.uniform(0.5, 1.5))
+        await self._think_delay(0.5, 1.5)
 
-        hand_dicts = [c.to_dict() for c in player.hand]
-        choice = self.brain.choose_double_card(hand_dicts, artist)
+        hand_artists, hand_types = player.hand_soa()
+        choice = self.brain.choose_double_card(hand_artists, hand_types, artist)
         await game.handle_double_response(player_index, choice)
 
     async def process_auction_action(self, game: "Game", player_index: int) -> None:
@@ -375,22 +428,57 @@ class AIPlayerController:
             log.warning("AI auction_action: P%d no auction active", player_index)
             return
 
-        player = game.players[player_index]
         auction = game.current_auction
+        action, value = await self._decide_auction_action(game, player_index, auction)
+        await self._execute_auction_action(game, player_index, auction, action, value)
+
+    async def process_sealed_bids(self, game: "Game",
+                                  player_indices: List[int]) -> None:
+        """Process several AI sealed bids at once.
+
+        Sealed bids are simultaneous, so all think phases run concurrently;
+        the bids are then submitted one by one in seat order.
+        """
+        auction = game.current_auction
+        if not auction:
+            log.warning("AI sealed_bids: no auction active")
+            return
+
+        decisions = await asyncio.gather(
+            *[self._decide_auction_action(game, i, auction) for i in player_indices]
+        )
+        for player_index, (action, value) in zip(player_indices, decisions):
+            if game.current_auction is not auction:
+                return  # Auction resolved
+            await self._execute_auction_action(game, player_index, auction,
+                                               action, value)
+
+    async def _decide_auction_action(self, game: "Game", player_index: int,
+                                     auction: "Auction") -> tuple:
+        """Run the think phase within AI_TIMEOUT, defaulting to pass."""
+        player = game.players[player_index]
 
         log.debug("AI auction_action: P%d %s type=%s cur_bid=%d",
                   player_index, player.name, auction.auction_type, auction.current_bid)
 
-        try:
-            action, value = await asyncio.wait_for(
-                self._think_auction(game, player_index), timeout=self.AI_TIMEOUT
-            )
-        except asyncio.TimeoutError:
+        deadline = asyncio.get_running_loop().time() + self.AI_TIMEOUT
+        decision = await self._think_auction(game, player_index, auction, deadline)
+        if decision is None:
             log.warning("AI TIMEOUT auction: P%d %s - defaulting to pass",
                         player_index, player.name)
-            action, value = "pass", 0
+            return "pass", 0
+        return decision
+
+    async def _execute_auction_action(self, game: "Game", player_index: int,
+                                      auction: "Auction", action: str,
+                                      value: int) -> None:
+        """Execute a decided auction action."""
+        if game.current_auction is not auction:
+            # Resolved while we were thinking; the decision is stale
+            log.debug("AI auction_action: P%d auction already resolved", player_index)
+            return
+        player = game.players[player_index]
 
-        # Execute the decided action (never cancelled by timeout)
         if action == "bid":
             log.debug("AI auction_action: P%d %s %s bid=%d",
                       player_index, player.name, auction.auction_type, value)
@@ -407,14 +495,17 @@ class AIPlayerController:
                       player_index, player.name, auction.auction_type)
             await game.handle_pass(player_index)
 
-    async def _think_auction(self, game: "Game", player_index: int) -> tuple:
-        """Think phase for auction decision (can be timed out safely)."""
+    async def _think_auction(self, game: "Game", player_index: int,
+                             auction: "Auction",
+                             deadline: float) -> Optional[tuple]:
+        """Think phase for auction decision. Returns None past the deadline."""
         player = game.players[player_index]
-        auction = game.current_auction
         card = auction.card
         is_double = auction.double_card is not None
 
-        await asyncio.sleep(random.uniform(0.8, 2.0))
+        await self._think_delay(0.8, 2.0)
+        if asyncio.get_running_loop().time() > deadline:
+            return None
 
         if auction.auction_type == "open":
             bid = self.brain.decide_bid_open(
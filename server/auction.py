@@ -1,26 +1,75 @@
 """Auction mechanics for all 5 auction types in Modern Art."""
 
+import functools
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
-from enum import Enum
+from typing import List, Dict, NamedTuple, Optional, Tuple
+from enum import IntEnum
 
+from compat import DATACLASS_SLOTS
 
-class AuctionState(Enum):
-    WAITING_FOR_BIDS = "waiting_for_bids"
-    WAITING_FOR_PRICE = "waiting_for_price"
-    WAITING_FOR_ACCEPT = "waiting_for_accept"
-    WAITING_FOR_DOUBLE = "waiting_for_double"
-    RESOLVED = "resolved"
 
+class AuctionType(IntEnum):
+    OPEN = 0
+    ONCE_AROUND = 1
+    SEALED = 2
+    FIXED_PRICE = 3
+    DOUBLE = 4
 
-@dataclass
-class AuctionResult:
+
+class ActionType(IntEnum):
+    BID = 0
+    PASS = 1
+    SET_PRICE = 2
+    ACCEPT = 3
+    DECLINE = 4
+
+
+# Smallest money step; the client sends amounts already multiplied by it
+BID_UNIT = 1000
+_ERR_BID_UNIT = f"Bid must be in multiples of {BID_UNIT}"
+_ERR_PRICE_UNIT = f"Price must be in multiples of {BID_UNIT}"
+
+# Wire names ("open", "set_price", ...) -> enum members
+_AUCTION_TYPES = {t.name.lower(): t for t in AuctionType}
+_ACTION_TYPES = {t.name.lower(): t for t in ActionType}
+
+
+class AuctionState(IntEnum):
+    WAITING_FOR_BIDS = 0
+    WAITING_FOR_PRICE = 1
+    WAITING_FOR_ACCEPT = 2
+    WAITING_FOR_DOUBLE = 3
+    RESOLVED = 4
+
+
+# Who may act, per (AuctionType, AuctionState); pairs not listed mean no
+# single player (open / sealed auctions, resolved auctions)
+_CAN_ACT_SELLER = 0
+_CAN_ACT_TURN = 1
+_CAN_ACT: Dict[Tuple[int, int], int] = {}
+for _state in AuctionState:
+    if _state != AuctionState.RESOLVED:
+        _CAN_ACT[(AuctionType.ONCE_AROUND, _state)] = _CAN_ACT_TURN
+        _CAN_ACT[(AuctionType.FIXED_PRICE, _state)] = (
+            _CAN_ACT_SELLER if _state == AuctionState.WAITING_FOR_PRICE
+            else _CAN_ACT_TURN)
+del _state
+
+
+@functools.lru_cache(maxsize=None)
+def _clockwise_rings(num_players: int) -> Tuple[Tuple[int, ...], ...]:
+    """For each seat, the other seats in clockwise order starting after it."""
+    return tuple(tuple((start + i) % num_players for i in range(1, num_players))
+                 for start in range(num_players))
+
+
+class AuctionResult(NamedTuple):
     winner_index: int  # -1 if no winner (seller keeps)
     price: int
     seller_index: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Auction:
     """Manages auction state and resolution for all 5 auction types."""
     auction_type: str
@@ -36,58 +85,57 @@ class Auction:
     fixed_price: int = 0
 
     # Tracking
-    bids: Dict[int, int] = field(default_factory=dict)
-    passed: List[int] = field(default_factory=list)
+    bids: List[int] = field(default_factory=list)  # Per player, -1 = no bid
+    passed_mask: int = 0  # Bit i set = player i has passed / had their turn
     current_turn_index: int = -1  # For once_around and fixed_price
     sealed_bids_received: int = 0
+    _atype: int = field(default=-1, init=False, repr=False)  # AuctionType of auction_type
+    # Highest sealed bid so far (ties: lowest index), kept by sealed_bid
+    _top_bid: int = field(default=-1, init=False, repr=False)
+    _top_bidder: int = field(default=-1, init=False, repr=False)
+    _ring: Tuple[Tuple[int, ...], ...] = field(default=(), init=False, repr=False)
+    _active_mask: int = field(default=0, init=False, repr=False)  # Open: non-sellers not passed
 
     def __post_init__(self):
-        if self.auction_type == "fixed_price":
+        if not self.bids:
+            self.bids = [-1] * self.num_players
+        self._ring = _clockwise_rings(self.num_players)
+        self._active_mask = ((1 << self.num_players) - 1) & ~(1 << self.seller_index)
+        self._atype = _AUCTION_TYPES.get(self.auction_type, -1)
+        if self._atype == AuctionType.FIXED_PRICE:
             self.state = AuctionState.WAITING_FOR_PRICE
-        elif self.auction_type == "double":
+        elif self._atype == AuctionType.DOUBLE:
             # Double auction: will be set up after second card is known
             pass
 
     def get_next_player(self, from_index: int) -> int:
         """Get next player index (clockwise from from_index, skipping passed players)."""
-        for i in range(1, self.num_players):
-            idx = (from_index + i) % self.num_players
-            if idx not in self.passed:
+        passed_mask = self.passed_mask
+        for idx in self._ring[from_index]:
+            if not (passed_mask >> idx) & 1:
                 return idx
         return -1
 
     def get_can_act_player(self) -> int:
         """Get the player index who can currently act, or -1."""
-        if self.state == AuctionState.RESOLVED:
-            return -1
-
-        if self.auction_type == "open":
-            return -1  # Anyone can bid in open auction
-
-        if self.auction_type == "once_around":
+        rule = _CAN_ACT.get((self._atype, self.state))
+        if rule == _CAN_ACT_TURN:
             return self.current_turn_index
-
-        if self.auction_type == "sealed":
-            return -1  # Everyone bids simultaneously
-
-        if self.auction_type == "fixed_price":
-            if self.state == AuctionState.WAITING_FOR_PRICE:
-                return self.seller_index
-            return self.current_turn_index
-
-        return -1
+        if rule == _CAN_ACT_SELLER:
+            return self.seller_index
+        return -1  # Anyone (open), everyone at once (sealed), or resolved
 
     # --- Open Auction ---
     def open_bid(self, player_index: int, amount: int) -> Optional[str]:
         """Process a bid in an open auction. Returns error message or None."""
-        if self.auction_type != "open":
+        if self._atype != AuctionType.OPEN:
             return "Wrong auction type"
         if player_index == self.seller_index:
             return "Seller cannot bid"
         if amount <= self.current_bid:
             return f"Bid must be higher than {self.current_bid}"
-        if amount % 1000 != 0:
-            return "Bid must be in multiples of 1000"
+        if amount % BID_UNIT:
+            return _ERR_BID_UNIT
 
         self.current_bid = amount
         self.current_bidder = player_index
@@ -96,15 +144,18 @@ class Auction:
 
     def open_pass(self, player_index: int) -> None:
         """Player passes in open auction."""
-        if player_index not in self.passed:
-            self.passed.append(player_index)
+        bit = 1 << player_index
+        self.passed_mask |= bit
+        self._active_mask &= ~bit
 
     def check_open_resolved(self) -> Optional[AuctionResult]:
         """Check if open auction is resolved (all non-seller players passed)."""
-        active = [i for i in range(self.num_players)
-                  if i != self.seller_index and i not in self.passed]
-        if len(active) == 0 or (len(active) == 1 and active[0] == self.current_bidder
-                                 and self.current_bid > 0):
+        # Resolved once nobody but the high bidder (if any) is still in.
+        # A bidder exists only after a positive bid, so current_bid > 0 holds.
+        challengers = self._active_mask
+        if self.current_bidder >= 0:
+            challengers &= ~(1 << self.current_bidder)
+        if not challengers:
             self.state = AuctionState.RESOLVED
             if self.current_bidder == -1:
                 # No one bid - seller gets the card for free
@@ -130,21 +181,20 @@ class Auction:
             return "Not your turn"
         if amount <= self.current_bid:
             return f"Bid must be higher than {self.current_bid}"
-        if amount % 1000 != 0:
-            return "Bid must be in multiples of 1000"
+        if amount % BID_UNIT:
+            return _ERR_BID_UNIT
 
         self.current_bid = amount
         self.current_bidder = player_index
         self.bids[player_index] = amount
         # Move to next player
-        self.passed.append(player_index)
+        self.passed_mask |= 1 << player_index
         self.current_turn_index = self.get_next_player(player_index)
         return None
 
     def once_around_pass(self, player_index: int) -> None:
         """Player passes in once-around."""
-        if player_index not in self.passed:
-            self.passed.append(player_index)
+        self.passed_mask |= 1 << player_index
         self.current_turn_index = self.get_next_player(player_index)
 
     def check_once_around_resolved(self) -> Optional[AuctionResult]:
@@ -168,20 +218,24 @@ class Auction:
         """Submit a sealed bid."""
         if player_index == self.seller_index:
             return "Seller cannot bid"
-        if player_index in self.bids:
+        if self.bids[player_index] >= 0:
             return "Already submitted a bid"
         if amount < 0:
             return "Invalid bid amount"
-        if amount % 1000 != 0:
-            return "Bid must be in multiples of 1000"
+        if amount % BID_UNIT:
+            return _ERR_BID_UNIT
 
         self.bids[player_index] = amount
         self.sealed_bids_received += 1
+        if amount > self._top_bid or (amount == self._top_bid
+                                      and player_index < self._top_bidder):
+            self._top_bid, self._top_bidder = amount, player_index
         return None
 
     def sealed_pass(self, player_index: int) -> None:
         """Pass on sealed bid (bid 0)."""
-        if player_index not in self.bids and player_index != self.seller_index:
+        # A 0 bid can never win, so the running top bid is left alone
+        if self.bids[player_index] < 0 and player_index != self.seller_index:
             self.bids[player_index] = 0
             self.sealed_bids_received += 1
 
@@ -190,15 +244,14 @@ class Auction:
         expected = self.num_players - 1  # Everyone except seller
         if self.sealed_bids_received >= expected:
             self.state = AuctionState.RESOLVED
-            if not self.bids or max(self.bids.values()) == 0:
+            if self._top_bid <= 0:
                 return AuctionResult(
                     winner_index=self.seller_index, price=0,
                     seller_index=self.seller_index
                 )
             # Highest bid wins (tie: first bidder wins - by lowest index)
-            winner = max(self.bids.items(), key=lambda x: (x[1], -x[0]))
             return AuctionResult(
-                winner_index=winner[0], price=winner[1],
+                winner_index=self._top_bidder, price=self._top_bid,
                 seller_index=self.seller_index
             )
         return None
@@ -210,8 +263,8 @@ class Auction:
             return "Not waiting for price"
         if price <= 0:
             return "Price must be positive"
-        if price % 1000 != 0:
-            return "Price must be in multiples of 1000"
+        if price % BID_UNIT:
+            return _ERR_PRICE_UNIT
 
         self.fixed_price = price
         self.current_bid = price
@@ -231,8 +284,7 @@ class Auction:
 
     def fixed_price_decline(self, player_index: int) -> None:
         """Player declines the fixed price."""
-        if player_index not in self.passed:
-            self.passed.append(player_index)
+        self.passed_mask |= 1 << player_index
         self.current_turn_index = self.get_next_player(player_index)
 
     def check_fixed_price_resolved(self) -> Optional[AuctionResult]:
@@ -252,6 +304,7 @@ class Auction:
     def setup_double(self, effective_type: str) -> None:
         """Set up the double auction with the effective auction type."""
         self.auction_type = effective_type
+        self._atype = _AUCTION_TYPES.get(effective_type, -1)
         if effective_type == "once_around":
             self.start_once_around()
         elif effective_type == "fixed_price":
@@ -267,45 +320,62 @@ class Auction:
 
         This is the main entry point for processing auction actions.
         """
-        error = None
-        result = None
-
-        if self.auction_type == "open":
-            if action == "bid":
-                error = self.open_bid(player_index, amount)
-                if not error:
-                    result = self.check_open_resolved()
-            elif action == "pass":
-                self.open_pass(player_index)
-                result = self.check_open_resolved()
-
-        elif self.auction_type == "once_around":
-            if action == "bid":
-                error = self.once_around_bid(player_index, amount)
-                if not error:
-                    result = self.check_once_around_resolved()
-            elif action == "pass":
-                self.once_around_pass(player_index)
-                result = self.check_once_around_resolved()
-
-        elif self.auction_type == "sealed":
-            if action == "bid":
-                error = self.sealed_bid(player_index, amount)
-                if not error:
-                    result = self.check_sealed_resolved()
-            elif action == "pass":
-                self.sealed_pass(player_index)
-                result = self.check_sealed_resolved()
-
-        elif self.auction_type == "fixed_price":
-            if action == "set_price":
-                error = self.set_fixed_price(amount)
-                if not error:
-                    result = self.check_fixed_price_resolved()
-            elif action == "accept":
-                result = self.fixed_price_accept(player_index)
-            elif action == "pass" or action == "decline":
-                self.fixed_price_decline(player_index)
-                result = self.check_fixed_price_resolved()
-
-        return error, result
+        action_type = _ACTION_TYPES.get(action)
+        if (action_type is None
+                or not (_VALID_ACTIONS.get(self._atype, 0) >> action_type) & 1):
+            return "Invalid action for auction type", None
+
+        mutate, resolve = _DISPATCH[(self._atype, action_type)]
+        if mutate is not None:
+            error = mutate(self, player_index, amount)
+            if error:
+                return error, None
+        result = resolve(self, player_index)
+        if result is None:
+            return _NO_ERR_NO_RESULT  # Accepted, auction still running
+        return None, result
+
+
+# Shared return value for the common "accepted, not resolved" case
+_NO_ERR_NO_RESULT: Tuple[None, None] = (None, None)
+
+
+# (auction type, action) -> (mutator, resolver).
+# mutator(auction, player_index, amount) returns an error message or None;
+# resolver(auction, player_index) returns the AuctionResult once resolved.
+_DISPATCH = {
+    (AuctionType.OPEN, ActionType.BID):
+        (Auction.open_bid, lambda a, p: a.check_open_resolved()),
+    (AuctionType.OPEN, ActionType.PASS):
+        (lambda a, p, amt: a.open_pass(p), lambda a, p: a.check_open_resolved()),
+
+    (AuctionType.ONCE_AROUND, ActionType.BID):
+        (Auction.once_around_bid, lambda a, p: a.check_once_around_resolved()),
+    (AuctionType.ONCE_AROUND, ActionType.PASS):
+        (lambda a, p, amt: a.once_around_pass(p),
+         lambda a, p: a.check_once_around_resolved()),
+
+    (AuctionType.SEALED, ActionType.BID):
+        (Auction.sealed_bid, lambda a, p: a.check_sealed_resolved()),
+    (AuctionType.SEALED, ActionType.PASS):
+        (lambda a, p, amt: a.sealed_pass(p), lambda a, p: a.check_sealed_resolved()),
+
+    (AuctionType.FIXED_PRICE, ActionType.SET_PRICE):
+        (lambda a, p, amt: a.set_fixed_price(amt),
+         lambda a, p: a.check_fixed_price_resolved()),
+    (AuctionType.FIXED_PRICE, ActionType.ACCEPT):
+        (None, Auction.fixed_price_accept),
+    (AuctionType.FIXED_PRICE, ActionType.PASS):
+        (lambda a, p, amt: a.fixed_price_decline(p),
+         lambda a, p: a.check_fixed_price_resolved()),
+    (AuctionType.FIXED_PRICE, ActionType.DECLINE):
+        (lambda a, p, amt: a.fixed_price_decline(p),
+         lambda a, p: a.check_fixed_price_resolved()),
+}
+
+# AuctionType -> bitmask of the ActionTypes it accepts (1 << action)
+_VALID_ACTIONS: Dict[int, int] = {}
+for _auction_type, _action_type in _DISPATCH:
+    _VALID_ACTIONS[_auction_type] = (_VALID_ACTIONS.get(_auction_type, 0)
+                                     | 1 << _action_type)
+del _auction_type, _action_type
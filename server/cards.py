@@ -1,12 +1,23 @@
 """Card definitions and deck management for Modern Art."""
 
+import functools
 import random
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Tuple
 
-ARTISTS = ["Orange Tarou", "Green Tarou", "Blue Tarou", "Yellow Tarou", "Red Tarou"]
+from compat import DATACLASS_SLOTS
 
-AUCTION_TYPES = ["open", "once_around", "sealed", "fixed_price", "double"]
+# Interned so dict lookups keyed by card.artist / auction_type hit the
+# identity fast path ("Orange Tarou" etc. are not auto-interned)
+ARTISTS = [sys.intern(a) for a in
+           ["Orange Tarou", "Green Tarou", "Blue Tarou", "Yellow Tarou", "Red Tarou"]]
+
+# Artist name -> position in ARTISTS (for list-indexed per-artist data)
+ARTIST_INDEX = {artist: i for i, artist in enumerate(ARTISTS)}
+
+AUCTION_TYPES = [sys.intern(t) for t in
+                 ["open", "once_around", "sealed", "fixed_price", "double"]]
 
 # Card distribution: (artist, total_cards)
 ARTIST_CARD_COUNTS = {
@@ -42,27 +53,43 @@ ROUND_VALUES = {
     3: 10000,  # Third
 }
 
+# Same values by 0-based rank, one entry per artist (0 for unranked)
+ROUND_VALUE_BY_RANK = tuple(ROUND_VALUES.get(rank + 1, 0)
+                            for rank in range(len(ARTISTS)))
+
 STARTING_MONEY = 100000
 MAX_ROUNDS = 4
 ROUND_END_CARD_COUNT = 5
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Card:
     card_id: int
     artist: str
     auction_type: str
+    # Position in ARTISTS, for the per-artist arrays on Game
+    artist_id: int = field(init=False, repr=False, compare=False)
+    _dict: Dict = field(init=False, repr=False, compare=False)
 
-    def to_dict(self) -> Dict:
-        return {
+    def __post_init__(self):
+        object.__setattr__(self, "artist_id", ARTIST_INDEX[self.artist])
+        object.__setattr__(self, "_dict", {
             "card_id": self.card_id,
             "artist": self.artist,
             "auction_type": self.auction_type,
-        }
+        })
 
+    def to_dict(self) -> Dict:
+        """Message form of the card, built once per Card.
 
-def create_deck() -> List[Card]:
-    """Create the full 70-card deck."""
+        The dict is shared by every caller (and every game using the
+        deck template), so treat it as read-only.
+        """
+        return self._dict
+
+
+def _build_deck() -> List[Card]:
+    """Build the full 70-card deck from AUCTION_DISTRIBUTION."""
     deck = []
     card_id = 0
     for artist in ARTISTS:
@@ -75,16 +102,33 @@ def create_deck() -> List[Card]:
     return deck
 
 
-def shuffle_deck(deck: List[Card]) -> List[Card]:
-    """Shuffle the deck in place and return it."""
-    random.shuffle(deck)
+# The deck never changes, so build it once. Cards are frozen, so sharing
+# them between games is safe (use dataclasses.replace for variants).
+_DECK_TEMPLATE: Tuple[Card, ...] = tuple(_build_deck())
+
+
+def create_deck() -> List[Card]:
+    """Create the full 70-card deck."""
+    return list(_DECK_TEMPLATE)
+
+
+def shuffle_deck(deck: List[Card],
+                 rng: Optional[random.Random] = None) -> List[Card]:
+    """Shuffle the deck in place and return it.
+
+    Pass a seeded random.Random as rng to replay a deal in simulations.
+    """
+    (rng or random).shuffle(deck)
     return deck
 
 
-def deal_cards(deck: List[Card], num_players: int, round_num: int) -> List[List[Card]]:
+def deal_cards(deck: List[Card], num_players: int, round_num: int,
+               hands: Optional[List[List[Card]]] = None) -> List[List[Card]]:
     """Deal cards to players for the given round.
 
-    Returns a list of hands (one per player).
+    Returns a list of hands (one per player). If hands is given, the cards
+    are added to those lists in place (e.g. the players' current hands)
+    and the same lists are returned.
     Cards are removed from the front of the deck.
     """
     if num_players not in DEAL_COUNTS:
@@ -93,16 +137,44 @@ def deal_cards(deck: List[Card], num_players: int, round_num: int) -> List[List[
         raise ValueError(f"Invalid round: {round_num}")
 
     count = DEAL_COUNTS[num_players][round_num - 1]
-    hands = [[] for _ in range(num_players)]
 
-    for _ in range(count):
-        for player_idx in range(num_players):
-            if deck:
-                hands[player_idx].append(deck.pop(0))
+    # Dealing is round robin (card i goes to player i % n), so each hand is
+    # a strided slice of the dealt prefix, which is then dropped in one go
+    dealt = min(count * num_players, len(deck))
+    if hands is None:
+        hands = [deck[p:dealt:num_players] for p in range(num_players)]
+    else:
+        for p in range(num_players):
+            hands[p].extend(deck[p:dealt:num_players])
+    del deck[:dealt]
 
     return hands
 
 
+def round_values_from_counts(counts: Sequence[int]) -> List[int]:
+    """Artist values for the round from per-artist card counts.
+
+    counts and the result are indexed like ARTISTS. Results are memoized
+    per board (there are only a few thousand reachable ones), so repeated
+    rounds in simulations skip the ranking entirely.
+    """
+    return list(_round_values_cached(tuple(counts)))
+
+
+@functools.lru_cache(maxsize=8192)
+def _round_values_cached(counts: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Ranking behind round_values_from_counts.
+
+    Ranks come from sorting plain (-count, index) tuples, so ties go to the
+    earlier artist without a key function or any dict work.
+    """
+    values = [0] * len(counts)
+    ranked = sorted([(-count, i) for i, count in enumerate(counts) if count > 0])
+    for rank, (_, i) in enumerate(ranked[:len(ROUND_VALUES)]):
+        values[i] = ROUND_VALUE_BY_RANK[rank]
+    return tuple(values)
+
+
 def calculate_round_values(board: Dict[str, int]) -> Dict[str, int]:
     """Calculate artist values for the round based on cards played.
 
@@ -112,19 +184,5 @@ def calculate_round_values(board: Dict[str, int]) -> Dict[str, int]:
     Returns:
         {artist_name: value_earned_this_round}
     """
-    # Sort artists by cards played (descending), filter out zero
-    sorted_artists = sorted(
-        [(artist, count) for artist, count in board.items() if count > 0],
-        key=lambda x: (-x[1], ARTISTS.index(x[0]))  # Tie-break by artist order
-    )
-
-    values = {}
-    for artist in ARTISTS:
-        values[artist] = 0
-
-    for rank, (artist, count) in enumerate(sorted_artists):
-        rank_1based = rank + 1
-        if rank_1based in ROUND_VALUES:
-            values[artist] = ROUND_VALUES[rank_1based]
-
-    return values
+    values = round_values_from_counts([board.get(a, 0) for a in ARTISTS])
+    return dict(zip(ARTISTS, values))
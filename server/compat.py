@@ -0,0 +1,7 @@
+"""Small helpers for running on older Python 3 releases."""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; the VPS python3 may be older.
+# Usage: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,35 +1,85 @@
 """Game state management and turn progression for Modern Art."""
 
 import asyncio
+import functools
 import logging
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+import operator
+import random
+from array import array
+from dataclasses import dataclass, field, replace
+from typing import Callable, List, Dict, Optional, Set, Tuple
 
 log = logging.getLogger("game")
 from cards import (
-    Card, create_deck, shuffle_deck, deal_cards, calculate_round_values,
-    ARTISTS, STARTING_MONEY, MAX_ROUNDS, ROUND_END_CARD_COUNT
+    Card, create_deck, shuffle_deck, deal_cards, round_values_from_counts,
+    ARTISTS, ARTIST_INDEX, STARTING_MONEY, MAX_ROUNDS, ROUND_END_CARD_COUNT
 )
 from auction import Auction, AuctionResult, AuctionState
+from compat import DATACLASS_SLOTS
 from protocol import *
 
 
-@dataclass
+# Frames queued per player before further ones are dropped (see Player.send)
+OUTBOX_LIMIT = 256
+
+
+def _turn_mask(player_index: int) -> int:
+    """can_act bit for the one player whose turn it is (-1 = nobody)."""
+    return 1 << player_index if player_index >= 0 else 0
+
+
+def _by_artist(values) -> Dict[str, int]:
+    """Per-artist array -> {artist_name: value} for messages and logs."""
+    return dict(zip(ARTISTS, values))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Player:
     player_id: str
     name: str
     ws: object  # WebSocket connection (None for AI players)
     money: int = STARTING_MONEY
     hand: List[Card] = field(default_factory=list)
-    paintings: List[Card] = field(default_factory=list)
+    paintings: List[Dict] = field(default_factory=list)
     is_ai: bool = False
+    # Paintings per artist, indexed like ARTISTS (kept by add_painting)
+    painting_counts: array = field(
+        default_factory=lambda: array("i", [0] * len(ARTISTS)))
+    # Hand cards per artist, indexed like ARTISTS (kept by Game._hand_pop /
+    # count_artists)
+    artist_counts: array = field(
+        default_factory=lambda: array("B", bytes(len(ARTISTS))))
+    # Outgoing frames, written in order by one task per player (see send)
+    _outbox: Optional[asyncio.Queue] = field(
+        default=None, init=False, repr=False, compare=False)
+    _writer: Optional[asyncio.Task] = field(
+        default=None, init=False, repr=False, compare=False)
+    # False once the socket is known to be gone (write failed or the
+    # player left); send() is then a no-op
+    alive: bool = field(default=True, init=False, compare=False)
+
+    def count_artists(self) -> None:
+        """Recount artist_counts from the hand (after dealing)."""
+        counts = self.artist_counts
+        for i in range(len(counts)):
+            counts[i] = 0
+        for card in self.hand:
+            counts[card.artist_id] += 1
+
+    def add_painting(self, card: Dict) -> None:
+        self.paintings.append(card)
+        artist_id = ARTIST_INDEX.get(card.get("artist", ""), -1)
+        if artist_id >= 0:
+            self.painting_counts[artist_id] += 1
+
+    def clear_paintings(self) -> None:
+        self.paintings = []
+        for i in range(len(self.painting_counts)):
+            self.painting_counts[i] = 0
 
     def to_dict(self, hide_hand: bool = True) -> Dict:
-        paintings_by_artist: Dict[str, int] = {}
-        for p in self.paintings:
-            a = p.get("artist", "")
-            if a:
-                paintings_by_artist[a] = paintings_by_artist.get(a, 0) + 1
+        paintings_by_artist = {a: c for a, c in zip(ARTISTS, self.painting_counts)
+                               if c}
         d = {
             "id": self.player_id,
             "name": self.name,
@@ -46,18 +96,92 @@ class Player:
     def to_public_dict(self) -> Dict:
         return self.to_dict(hide_hand=True)
 
+    def hand_soa(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Hand as parallel (artists, auction_types) tuples for AI scoring."""
+        return (tuple(c.artist for c in self.hand),
+                tuple(c.auction_type for c in self.hand))
+
+    def send(self, message: str) -> None:
+        """Queue a frame for this player's socket without waiting on it.
+
+        Frames are written in order by a writer task started on first use.
+        No-op for AI players (no WebSocket) and dead sockets. Used by both
+        Game and Lobby, so every frame to a seated player goes through the
+        same queue.
+        """
+        if self.ws is None or not self.alive:
+            return
+        if self._outbox is None:
+            self._outbox = asyncio.Queue(maxsize=OUTBOX_LIMIT)
+            self._writer = asyncio.get_running_loop().create_task(
+                self._write_frames(self.ws, self._outbox))
+        try:
+            self._outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            pass  # Client isn't reading; drop rather than grow without bound
+
+    def stop_sending(self) -> None:
+        """Stop the writer task (on disconnect); unsent frames are dropped."""
+        self.alive = False
+        if self._writer is not None:
+            self._writer.cancel()
+        self._outbox = None
+        self._writer = None
+
+    async def _write_frames(self, ws, outbox: asyncio.Queue) -> None:
+        while True:
+            # Take everything queued in one go; a broadcast burst is then
+            # written back to back, and aiohttp only drains the transport
+            # once its write buffer is over the limit
+            batch = [await outbox.get()]
+            while not outbox.empty():
+                batch.append(outbox.get_nowait())
+            for message in batch:
+                try:
+                    await ws.send_str(message)
+                except ConnectionError:
+                    # Transport is closing; nothing after this gets through
+                    self.alive = False
+                    self._outbox = None
+                    self._writer = None
+                    return
+                except Exception:
+                    pass  # A failed frame doesn't stop later ones, as before
+
 
 class Game:
     """Manages the full game state for one room."""
 
-    def __init__(self, players: List[Player], ai_controller=None):
+    __slots__ = (
+        "players", "ui_pace_seconds", "_has_humans", "rng", "num_players",
+        "deck", "round_num", "current_turn", "board", "market",
+        "current_auction", "round_active", "game_over", "waiting_for_double",
+        "double_base_card", "double_player_index", "ai_controller",
+        "_ai_processing", "_public_cache", "_coalesced_auction",
+        "_held_bid_update", "_can_act_sent", "_next_active", "_prev_active",
+        "_active_count",
+    )
+
+    # Pause after auction results and round/game ends so clients can show
+    # them. Only applied while a human is seated (AI-only games don't wait).
+    UI_PACE_SECONDS = 2.0
+
+    def __init__(self, players: List[Player], ai_controller=None,
+                 rng: Optional[random.Random] = None):
         self.players = players
+        self.ui_pace_seconds = self.UI_PACE_SECONDS
+        # Seating is fixed for the whole game (the lobby rebinds
+        # room.players on disconnect, it does not touch this list)
+        self._has_humans = any(not p.is_ai and p.ws is not None for p in players)
+        self.rng = rng  # Deck shuffling; None = module random
         self.num_players = len(players)
         self.deck: List[Card] = []
         self.round_num: int = 0
         self.current_turn: int = 0
-        self.board: Dict[str, int] = {a: 0 for a in ARTISTS}
-        self.market: Dict[str, int] = {a: 0 for a in ARTISTS}
+        # Per-artist card counts / market values, indexed like ARTISTS
+        # (Card.artist_id); see _by_artist for the dict form sent to clients
+        self.board = array("i", [0] * len(ARTISTS))
+        self.market = array("i", [0] * len(ARTISTS))
         self.current_auction: Optional[Auction] = None
         self.round_active: bool = False
         self.game_over: bool = False
@@ -66,6 +190,20 @@ class Game:
         self.double_player_index: int = -1
         self.ai_controller = ai_controller  # AIPlayerController instance
         self._ai_processing = False  # Guard against recursive AI triggers
+        # Player.to_public_dict() for all players; reset to None whenever
+        # money, hands or paintings change (see _public_players)
+        self._public_cache: Optional[List[Dict]] = None
+        # While AIs take a pass at an open auction their bid_updates are
+        # held and only the last one is sent (see _send_bid_update)
+        self._coalesced_auction: Optional[Auction] = None
+        self._held_bid_update: Optional[Tuple[int, int, int]] = None
+        # can_act bits (bit i = player i) as of the last can_act-bearing frame
+        self._can_act_sent: int = 0
+        # Circular list of players that still hold cards, in seat order;
+        # rebuilt on each deal, players unlinked as their hands run out
+        self._next_active: List[int] = []
+        self._prev_active: List[int] = []
+        self._active_count: int = 0
 
     def _is_ai(self, player_index: int) -> bool:
         return (0 <= player_index < len(self.players)
@@ -80,9 +218,10 @@ class Game:
 
     async def start(self) -> None:
         """Initialize and start the game."""
-        log.info("=== GAME START === players=%s",
-                 [self._pname(i) for i in range(self.num_players)])
-        self.deck = shuffle_deck(create_deck())
+        if log.isEnabledFor(logging.INFO):
+            log.info("=== GAME START === players=%s",
+                     [self._pname(i) for i in range(self.num_players)])
+        self.deck = shuffle_deck(create_deck(), self.rng)
         self.round_num = 1
         self.current_turn = 0
         self.round_active = True
@@ -91,16 +230,19 @@ class Game:
         hands = deal_cards(self.deck, self.num_players, self.round_num)
         for i, player in enumerate(self.players):
             player.hand = hands[i]
+        self._hands_dealt()
 
-        # Send game_started to each player with their hand
+        # Send game_started to each player with their hand (AI players have
+        # no socket, so don't build theirs)
         for i, player in enumerate(self.players):
-            await self._send(player, msg_game_started(
-                hand=[c.to_dict() for c in player.hand],
-                players=[p.to_public_dict() for p in self.players],
-                your_index=i,
-                round_num=self.round_num,
-                current_turn=self.current_turn,
-            ))
+            if player.ws is not None:
+                player.send(msg_game_started(
+                    hand=[c.to_dict() for c in player.hand],
+                    players=self._public_players(),
+                    your_index=i,
+                    round_num=self.round_num,
+                    current_turn=self.current_turn,
+                ))
 
         # Notify current player it's their turn
         await self._send(self.players[self.current_turn],
@@ -117,15 +259,18 @@ class Game:
         if not self.ai_controller:
             return
         self._ai_processing = True
-        log.debug("_trigger_ai_turn: START loop, current_turn=%s", self._pname(self.current_turn))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("_trigger_ai_turn: START loop, current_turn=%s",
+                      self._pname(self.current_turn))
         try:
             while (self.round_active and not self.game_over
                     and self.current_auction is None
                     and not self.waiting_for_double
                     and self._is_ai(self.current_turn)):
-                log.info("[AI TURN] %s (round=%d, board=%s)",
-                         self._pname(self.current_turn), self.round_num,
-                         {a: c for a, c in self.board.items() if c > 0})
+                if log.isEnabledFor(logging.INFO):
+                    log.info("[AI TURN] %s (round=%d, board=%s)",
+                             self._pname(self.current_turn), self.round_num,
+                             {a: c for a, c in zip(ARTISTS, self.board) if c > 0})
                 await self.ai_controller.process_turn(self, self.current_turn)
                 log.debug("_trigger_ai_turn: after process_turn, state: round_active=%s game_over=%s auction=%s turn=%s",
                           self.round_active, self.game_over,
@@ -141,7 +286,9 @@ class Game:
 
         auction = self.current_auction
         auction_type = auction.auction_type
-        log.debug("[AI AUCTION] trigger type=%s seller=%s", auction_type, self._pname(auction.seller_index))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[AI AUCTION] trigger type=%s seller=%s",
+                      auction_type, self._pname(auction.seller_index))
 
         if auction_type == "open":
             # In open auction, all AI non-sellers act
@@ -162,33 +309,49 @@ class Game:
         chance to bid or pass.  If a human can still act afterwards, we
         stop so they can respond.  If only AIs remain active, we loop for
         another round until all AIs pass or the auction resolves.
+
+        An AI is only eligible while it has something to answer: it has not
+        passed and does not hold the high bid. A pass that ends with an AI
+        on top therefore doesn't ask that AI to outbid itself.
         """
         if not self.current_auction:
             return
         auction_ref = self.current_auction
-        while (self.current_auction is auction_ref
-               and auction_ref.state != AuctionState.RESOLVED):
-            any_acted = False
-            # One full pass: each eligible AI acts once
-            for i, player in enumerate(self.players):
-                if (player.is_ai and i != auction_ref.seller_index
-                        and i not in auction_ref.passed
-                        and self.current_auction is auction_ref
-                        and auction_ref.state != AuctionState.RESOLVED):
-                    await self.ai_controller.process_auction_action(self, i)
+        ai_mask = 0
+        for i, player in enumerate(self.players):
+            if player.is_ai:
+                ai_mask |= 1 << i
+        # Everyone but the seller; AND with ~passed_mask for who is still in
+        bidders_mask = ((1 << len(self.players)) - 1) & ~(1 << auction_ref.seller_index)
+        # Resolving this auction can start (and trigger) the next one from
+        # inside the loop, so keep whatever an outer trigger was holding
+        outer = (self._coalesced_auction, self._held_bid_update)
+        self._coalesced_auction, self._held_bid_update = auction_ref, None
+        try:
+            while (self.current_auction is auction_ref
+                   and auction_ref.state != AuctionState.RESOLVED):
+                any_acted = False
+                # One full pass: each eligible AI acts once, in seat order. AIs
+                # only ever pass for themselves, so the set can be taken up front.
+                mask = (ai_mask & bidders_mask & ~auction_ref.passed_mask
+                        & ~_turn_mask(auction_ref.current_bidder))
+                while mask and auction_ref.state != AuctionState.RESOLVED:
+                    low = mask & -mask
+                    mask ^= low
+                    await self.ai_controller.process_auction_action(
+                        self, low.bit_length() - 1)
                     if self.current_auction is not auction_ref:
                         return  # Auction resolved during AI action
                     any_acted = True
-            if not any_acted:
-                break  # No AI could act, done
-            # If a human player can still bid, pause so they can respond
-            human_can_act = any(
-                not p.is_ai and i != auction_ref.seller_index
-                and i not in auction_ref.passed
-                for i, p in enumerate(self.players)
-            )
-            if human_can_act:
-                break  # Wait for human before next AI round
+                if not any_acted:
+                    break  # No AI could act, done
+                # One bid_update for the whole pass
+                await self._flush_bid_update()
+                # If a human player can still bid, pause so they can respond
+                if bidders_mask & ~ai_mask & ~auction_ref.passed_mask:
+                    break  # Wait for human before next AI round
+        finally:
+            self._coalesced_auction, self._held_bid_update = outer
 
     async def _trigger_ai_sequential_auction(self) -> None:
         """Handle AI in once_around where one player acts at a time (loop)."""
@@ -210,13 +373,11 @@ class Game:
         if not self.current_auction:
             return
         auction_ref = self.current_auction
-        for i, player in enumerate(self.players):
-            if (player.is_ai and i != auction_ref.seller_index
-                    and i not in auction_ref.bids
-                    and self.current_auction is auction_ref):
-                await self.ai_controller.process_auction_action(self, i)
-                if self.current_auction is not auction_ref:
-                    return  # Auction resolved
+        pending = [i for i, player in enumerate(self.players)
+                   if player.is_ai and i != auction_ref.seller_index
+                   and auction_ref.bids[i] < 0]
+        if pending:
+            await self.ai_controller.process_sealed_bids(self, pending)
 
     async def _trigger_ai_fixed_price_auction(self) -> None:
         """Handle AI in fixed price auction (loop through price setting + accepts)."""
@@ -245,20 +406,20 @@ class Game:
                                 double_card_index: int = -1) -> None:
         """Handle a player playing a card from their hand."""
         if self.game_over or not self.round_active:
-            await self._send_error(self.players[player_index], "Game not active")
+            await self._send(self.players[player_index], ERR_GAME_NOT_ACTIVE)
             return
 
         if self.current_auction is not None:
-            await self._send_error(self.players[player_index], "Auction in progress")
+            await self._send(self.players[player_index], ERR_AUCTION_IN_PROGRESS)
             return
 
         if player_index != self.current_turn:
-            await self._send_error(self.players[player_index], "Not your turn")
+            await self._send(self.players[player_index], ERR_NOT_YOUR_TURN)
             return
 
         player = self.players[player_index]
         if card_index < 0 or card_index >= len(player.hand):
-            await self._send_error(player, "Invalid card index")
+            await self._send(player, ERR_INVALID_CARD_INDEX)
             return
 
         card = player.hand[card_index]
@@ -267,25 +428,23 @@ class Game:
         if card.auction_type == "double":
             if double_card_index >= 0:
                 if double_card_index >= len(player.hand) or double_card_index == card_index:
-                    await self._send_error(player, "Invalid double card index")
+                    await self._send(player, ERR_INVALID_DOUBLE_CARD_INDEX)
                     return
                 second_card = player.hand[double_card_index]
                 if second_card.artist != card.artist:
-                    await self._send_error(player, "Double card must be same artist")
+                    await self._send(player, ERR_DOUBLE_CARD_ARTIST)
                     return
                 await self._play_double(player_index, card, card_index,
                                          second_card, double_card_index)
                 return
             else:
-                has_match = any(
-                    c.artist == card.artist and i != card_index
-                    for i, c in enumerate(player.hand)
-                )
+                # card itself is still in the hand, so a partner means >= 2
+                has_match = player.artist_counts[card.artist_id] >= 2
                 if has_match:
                     self.waiting_for_double = True
                     self.double_base_card = card
                     self.double_player_index = player_index
-                    player.hand.pop(card_index)
+                    self._hand_pop(player_index, card_index)
                     await self._broadcast(msg_double_request(player_index, card.artist))
                     # If this is an AI player, auto-respond to double
                     if player.is_ai and self.ai_controller:
@@ -293,7 +452,8 @@ class Game:
                             self, player_index, card.artist)
                     return
                 else:
-                    card.auction_type = "open"
+                    # No partner: plays as open (deck cards are shared, so copy)
+                    card = replace(card, auction_type="open")
 
         await self._play_single_card(player_index, card, card_index)
 
@@ -312,57 +472,35 @@ class Game:
         if second_card_index >= 0 and second_card_index < len(player.hand):
             second_card = player.hand[second_card_index]
             if second_card.artist == base_card.artist:
-                player.hand.pop(second_card_index)
+                self._hand_pop(player_index, second_card_index)
                 effective_type = second_card.auction_type
                 if effective_type == "double":
                     effective_type = "open"
 
-                log.info("[DOUBLE] %s plays %s x2 (%s), board[%s]=%d->%d",
-                         self._pname(player_index), base_card.artist,
-                         effective_type, base_card.artist,
-                         self.board[base_card.artist],
-                         self.board[base_card.artist] + 2)
-
-                self.board[base_card.artist] += 1
-                if self._check_round_end(base_card.artist):
-                    log.info("[DOUBLE ROUND END] %s board[%s]=%d (1st card)",
+                if log.isEnabledFor(logging.INFO):
+                    log.info("[DOUBLE] %s plays %s x2 (%s), board[%s]=%d->%d",
                              self._pname(player_index), base_card.artist,
-                             self.board[base_card.artist])
-                    await self._broadcast(msg_card_played(
-                        artist=base_card.artist,
-                        board_count=self.board[base_card.artist],
-                        player_index=player_index,
-                        player_name=player.name,
-                        auction_type=effective_type,
-                        is_double=True,
-                    ))
-                    await self._end_round()
-                    return
-
-                self.board[base_card.artist] += 1
-                if self._check_round_end(base_card.artist):
-                    log.info("[DOUBLE ROUND END] %s board[%s]=%d (2nd card)",
-                             self._pname(player_index), base_card.artist,
-                             self.board[base_card.artist])
-                    await self._broadcast(msg_card_played(
-                        artist=base_card.artist,
-                        board_count=self.board[base_card.artist],
-                        player_index=player_index,
-                        player_name=player.name,
-                        auction_type=effective_type,
-                        is_double=True,
-                    ))
-                    await self._end_round()
-                    return
+                             effective_type, base_card.artist,
+                             self.board[base_card.artist_id],
+                             self.board[base_card.artist_id] + 2)
 
+                round_over = self._place_double(base_card.artist_id)
                 await self._broadcast(msg_card_played(
                     artist=base_card.artist,
-                    board_count=self.board[base_card.artist],
+                    board_count=self.board[base_card.artist_id],
                     player_index=player_index,
                     player_name=player.name,
                     auction_type=effective_type,
                     is_double=True,
                 ))
+                if round_over:
+                    if log.isEnabledFor(logging.INFO):
+                        log.info("[DOUBLE ROUND END] %s board[%s]=%d",
+                                 self._pname(player_index), base_card.artist,
+                                 self.board[base_card.artist_id])
+                    await self._end_round()
+                    return
+
                 await self._start_auction(player_index, base_card,
                                            effective_type, second_card)
                 return
@@ -371,21 +509,22 @@ class Game:
                 self.waiting_for_double = True
                 self.double_base_card = base_card
                 self.double_player_index = player_index
-                await self._send_error(player, "Same artist card required")
+                await self._send(player, ERR_SAME_ARTIST_REQUIRED)
                 return
 
         # No second card - play base card as open auction
-        log.info("[DOUBLE DECLINE] %s plays %s as open, board[%s]=%d->%d",
-                 self._pname(player_index), base_card.artist,
-                 base_card.artist, self.board[base_card.artist],
-                 self.board[base_card.artist] + 1)
-        self.board[base_card.artist] += 1
-        if self._check_round_end(base_card.artist):
+        if log.isEnabledFor(logging.INFO):
+            log.info("[DOUBLE DECLINE] %s plays %s as open, board[%s]=%d->%d",
+                     self._pname(player_index), base_card.artist,
+                     base_card.artist, self.board[base_card.artist_id],
+                     self.board[base_card.artist_id] + 1)
+        self._place_on_board(base_card.artist_id)
+        if self._check_round_end(base_card.artist_id):
             log.info("[DOUBLE DECLINE ROUND END] board[%s]=%d",
-                     base_card.artist, self.board[base_card.artist])
+                     base_card.artist, self.board[base_card.artist_id])
             await self._broadcast(msg_card_played(
                 artist=base_card.artist,
-                board_count=self.board[base_card.artist],
+                board_count=self.board[base_card.artist_id],
                 player_index=player_index,
                 player_name=player.name,
                 auction_type="open",
@@ -395,7 +534,7 @@ class Game:
 
         await self._broadcast(msg_card_played(
             artist=base_card.artist,
-            board_count=self.board[base_card.artist],
+            board_count=self.board[base_card.artist_id],
             player_index=player_index,
             player_name=player.name,
             auction_type="open",
@@ -405,18 +544,19 @@ class Game:
     async def _play_single_card(self, player_index: int, card: Card,
                                  card_index: int) -> None:
         """Play a single card and start its auction."""
-        log.info("[PLAY] %s plays %s (%s), board[%s]=%d",
-                 self._pname(player_index), card.artist, card.auction_type,
-                 card.artist, self.board.get(card.artist, 0) + 1)
+        if log.isEnabledFor(logging.INFO):
+            log.info("[PLAY] %s plays %s (%s), board[%s]=%d",
+                     self._pname(player_index), card.artist, card.auction_type,
+                     card.artist, self.board[card.artist_id] + 1)
         player = self.players[player_index]
-        player.hand.pop(card_index)
+        self._hand_pop(player_index, card_index)
 
-        self.board[card.artist] += 1
+        self._place_on_board(card.artist_id)
 
-        if self._check_round_end(card.artist):
+        if self._check_round_end(card.artist_id):
             await self._broadcast(msg_card_played(
                 artist=card.artist,
-                board_count=self.board[card.artist],
+                board_count=self.board[card.artist_id],
                 player_index=player_index,
                 player_name=player.name,
                 auction_type=card.auction_type,
@@ -426,7 +566,7 @@ class Game:
 
         await self._broadcast(msg_card_played(
             artist=card.artist,
-            board_count=self.board[card.artist],
+            board_count=self.board[card.artist_id],
             player_index=player_index,
             player_name=player.name,
             auction_type=card.auction_type,
@@ -441,57 +581,34 @@ class Game:
 
         indices = sorted([idx1, idx2], reverse=True)
         for idx in indices:
-            player.hand.pop(idx)
+            self._hand_pop(player_index, idx)
 
         effective_type = card2.auction_type
         if effective_type == "double":
             effective_type = "open"
 
-        log.info("[DOUBLE] %s plays %s x2 (%s), board[%s]=%d->%d",
-                 self._pname(player_index), card1.artist, effective_type,
-                 card1.artist, self.board[card1.artist],
-                 self.board[card1.artist] + 2)
-
-        self.board[card1.artist] += 1
-        if self._check_round_end(card1.artist):
-            log.info("[DOUBLE ROUND END] %s board[%s]=%d (1st card)",
-                     self._pname(player_index), card1.artist,
-                     self.board[card1.artist])
-            await self._broadcast(msg_card_played(
-                artist=card1.artist,
-                board_count=self.board[card1.artist],
-                player_index=player_index,
-                player_name=player.name,
-                auction_type="double",
-                is_double=True,
-            ))
-            await self._end_round()
-            return
-
-        self.board[card1.artist] += 1
-        if self._check_round_end(card1.artist):
-            log.info("[DOUBLE ROUND END] %s board[%s]=%d (2nd card)",
-                     self._pname(player_index), card1.artist,
-                     self.board[card1.artist])
-            await self._broadcast(msg_card_played(
-                artist=card1.artist,
-                board_count=self.board[card1.artist],
-                player_index=player_index,
-                player_name=player.name,
-                auction_type="double",
-                is_double=True,
-            ))
-            await self._end_round()
-            return
+        if log.isEnabledFor(logging.INFO):
+            log.info("[DOUBLE] %s plays %s x2 (%s), board[%s]=%d->%d",
+                     self._pname(player_index), card1.artist, effective_type,
+                     card1.artist, self.board[card1.artist_id],
+                     self.board[card1.artist_id] + 2)
 
+        round_over = self._place_double(card1.artist_id)
         await self._broadcast(msg_card_played(
             artist=card1.artist,
-            board_count=self.board[card1.artist],
+            board_count=self.board[card1.artist_id],
             player_index=player_index,
             player_name=player.name,
-            auction_type=effective_type,
+            auction_type="double" if round_over else effective_type,
             is_double=True,
         ))
+        if round_over:
+            if log.isEnabledFor(logging.INFO):
+                log.info("[DOUBLE ROUND END] %s board[%s]=%d",
+                         self._pname(player_index), card1.artist,
+                         self.board[card1.artist_id])
+            await self._end_round()
+            return
 
         await self._start_auction(player_index, card1, effective_type, card2)
 
@@ -499,82 +616,75 @@ class Game:
                               auction_type: str,
                               double_card: Card = None) -> None:
         """Start an auction for the given card."""
-        log.info("[AUCTION START] type=%s seller=%s artist=%s%s",
-                 auction_type, self._pname(seller_index), card.artist,
-                 " (double)" if double_card else "")
+        if log.isEnabledFor(logging.INFO):
+            log.info("[AUCTION START] type=%s seller=%s artist=%s%s",
+                     auction_type, self._pname(seller_index), card.artist,
+                     " (double)" if double_card else "")
+        card_d = card.to_dict()
+        double_d = double_card.to_dict() if double_card else None
         self.current_auction = Auction(
             auction_type=auction_type,
             seller_index=seller_index,
-            card=card.to_dict(),
+            card=card_d,
             num_players=self.num_players,
-            double_card=double_card.to_dict() if double_card else None,
+            double_card=double_d,
         )
 
         if auction_type == "once_around":
             self.current_auction.start_once_around()
 
-        for i, player in enumerate(self.players):
-            can_act_player = self.current_auction.get_can_act_player()
-            can_act = False
-            if auction_type == "open":
-                can_act = (i != seller_index)
-            elif auction_type == "sealed":
-                can_act = (i != seller_index)
-            else:
-                can_act = (i == can_act_player)
-
-            await self._send(player, msg_auction_started(
-                auction_type=auction_type,
-                card=card.to_dict(),
-                seller_index=seller_index,
-                current_bid=0,
-                can_act=can_act,
-                fixed_price=0,
-                double_card=double_card.to_dict() if double_card else None,
-            ))
+        if auction_type in ("open", "sealed"):
+            can_act_mask = self._everyone_mask() & ~(1 << seller_index)
+        else:
+            can_act_mask = _turn_mask(self.current_auction.get_can_act_player())
+
+        await self._send_by_can_act(functools.partial(
+            msg_auction_started,
+            auction_type=auction_type,
+            card=card_d,
+            seller_index=seller_index,
+            current_bid=0,
+            fixed_price=0,
+            double_card=double_d,
+        ), can_act_mask)
 
         # Trigger AI auction actions
         await self._trigger_ai_auction_if_needed()
 
     async def handle_bid(self, player_index: int, amount: int) -> None:
         """Handle a bid from a player."""
-        log.info("[BID] %s bids %d (type=%s)", self._pname(player_index), amount,
-                 self.current_auction.auction_type if self.current_auction else "?")
+        if log.isEnabledFor(logging.INFO):
+            log.info("[BID] %s bids %d (type=%s)", self._pname(player_index), amount,
+                     self.current_auction.auction_type if self.current_auction else "?")
         if not self.current_auction:
             return
 
         player = self.players[player_index]
         if amount > player.money:
-            await self._send_error(player, "Not enough money")
+            await self._send(player, ERR_NOT_ENOUGH_MONEY)
             return
 
-        error, result = self.current_auction.process_action(
-            player_index, "bid", amount
-        )
+        auction = self.current_auction
+        error, result = auction.process_action(player_index, "bid", amount)
 
         if error:
             await self._send_error(player, error)
             return
 
         if self.current_auction.auction_type != "sealed":
-            for i, p in enumerate(self.players):
-                can_act_player = self.current_auction.get_can_act_player()
-                can_act = False
-                if self.current_auction.auction_type == "open":
-                    can_act = (i != self.current_auction.seller_index and
-                               i != player_index and
-                               i not in self.current_auction.passed)
-                else:
-                    can_act = (i == can_act_player)
-                await self._send(p, msg_bid_update(
-                    player_index=player_index,
-                    player_name=player.name,
-                    amount=amount,
-                    can_act=can_act,
-                ))
+            if auction.auction_type == "open":
+                can_act_mask = (self._everyone_mask() & ~(1 << auction.seller_index)
+                                & ~(1 << player_index) & ~auction.passed_mask)
+            else:
+                can_act_mask = _turn_mask(auction.get_can_act_player())
+            await self._send_bid_update(auction, player_index, amount, can_act_mask)
         else:
             await self._send(player, make_message("bid_confirmed", amount=amount))
 
+        if self.current_auction is not auction:
+            # Resolved by a concurrent action while the updates were sent
+            return
+
         if result:
             await self._resolve_auction(result)
         elif not self._is_ai(player_index):
@@ -583,31 +693,29 @@ class Game:
 
     async def handle_pass(self, player_index: int) -> None:
         """Handle a pass from a player."""
-        log.info("[PASS] %s passes (type=%s)", self._pname(player_index),
-                 self.current_auction.auction_type if self.current_auction else "?")
+        if log.isEnabledFor(logging.INFO):
+            log.info("[PASS] %s passes (type=%s)", self._pname(player_index),
+                     self.current_auction.auction_type if self.current_auction else "?")
         if not self.current_auction:
             return
 
-        error, result = self.current_auction.process_action(player_index, "pass")
+        auction = self.current_auction
+        error, result = auction.process_action(player_index, "pass")
         if error:
             await self._send_error(self.players[player_index], error)
             return
 
         if self.current_auction.auction_type != "sealed":
-            for i, p in enumerate(self.players):
-                can_act_player = self.current_auction.get_can_act_player()
-                can_act = False
-                if self.current_auction.auction_type == "open":
-                    can_act = (i != self.current_auction.seller_index and
-                               i not in self.current_auction.passed)
-                else:
-                    can_act = (i == can_act_player)
-                await self._send(p, msg_bid_update(
-                    player_index=player_index,
-                    player_name=self.players[player_index].name,
-                    amount=0,
-                    can_act=can_act,
-                ))
+            if auction.auction_type == "open":
+                can_act_mask = (self._everyone_mask() & ~(1 << auction.seller_index)
+                                & ~auction.passed_mask)
+            else:
+                can_act_mask = _turn_mask(auction.get_can_act_player())
+            await self._send_bid_update(auction, player_index, 0, can_act_mask)
+
+        if self.current_auction is not auction:
+            # Resolved by a concurrent action while the updates were sent
+            return
 
         if result:
             await self._resolve_auction(result)
@@ -617,14 +725,15 @@ class Game:
 
     async def handle_accept(self, player_index: int) -> None:
         """Handle accept in fixed price auction."""
-        log.info("[ACCEPT] %s accepts fixed_price=%d", self._pname(player_index),
-                 self.current_auction.fixed_price if self.current_auction else 0)
+        if log.isEnabledFor(logging.INFO):
+            log.info("[ACCEPT] %s accepts fixed_price=%d", self._pname(player_index),
+                     self.current_auction.fixed_price if self.current_auction else 0)
         if not self.current_auction:
             return
         if self.current_auction.auction_type != "fixed_price":
             return
         if self.current_auction.fixed_price > self.players[player_index].money:
-            await self._send_error(self.players[player_index], "Not enough money")
+            await self._send(self.players[player_index], ERR_NOT_ENOUGH_MONEY)
             return
 
         error, result = self.current_auction.process_action(player_index, "accept")
@@ -636,7 +745,8 @@ class Game:
 
     async def handle_set_price(self, player_index: int, price: int) -> None:
         """Handle seller setting fixed price."""
-        log.info("[SET_PRICE] %s sets price=%d", self._pname(player_index), price)
+        if log.isEnabledFor(logging.INFO):
+            log.info("[SET_PRICE] %s sets price=%d", self._pname(player_index), price)
         if not self.current_auction:
             return
         if self.current_auction.auction_type != "fixed_price":
@@ -644,22 +754,19 @@ class Game:
         if player_index != self.current_auction.seller_index:
             return
 
-        error, result = self.current_auction.process_action(
-            player_index, "set_price", price
-        )
+        auction = self.current_auction
+        error, result = auction.process_action(player_index, "set_price", price)
 
         if error:
             await self._send_error(self.players[player_index], error)
             return
 
-        for i, p in enumerate(self.players):
-            can_act_player = self.current_auction.get_can_act_player()
-            await self._send(p, msg_bid_update(
-                player_index=player_index,
-                player_name=self.players[player_index].name,
-                amount=price,
-                can_act=(i == can_act_player),
-            ))
+        await self._emit_bid_update(player_index, price,
+                                    _turn_mask(auction.get_can_act_player()))
+
+        if self.current_auction is not auction:
+            # Resolved by a concurrent action while the updates were sent
+            return
 
         if result:
             await self._resolve_auction(result)
@@ -669,9 +776,10 @@ class Game:
 
     async def _resolve_auction(self, result: AuctionResult) -> None:
         """Resolve an auction and transfer money/paintings."""
-        log.info("[AUCTION END] winner=%s price=%d seller=%s",
-                 self._pname(result.winner_index), result.price,
-                 self._pname(result.seller_index))
+        if log.isEnabledFor(logging.INFO):
+            log.info("[AUCTION END] winner=%s price=%d seller=%s",
+                     self._pname(result.winner_index), result.price,
+                     self._pname(result.seller_index))
         winner = self.players[result.winner_index]
         seller = self.players[result.seller_index]
 
@@ -681,33 +789,39 @@ class Game:
             winner.money -= result.price
             seller.money += result.price
 
-        winner.paintings.append(card_info)
+        winner.add_painting(card_info)
+        self._public_cache = None
         self.current_auction = None
 
-        await self._broadcast(msg_auction_result(
-            winner_index=result.winner_index,
-            winner_name=winner.name,
-            price=result.price,
-            card=card_info,
-            players=[p.to_public_dict() for p in self.players],
-        ))
+        if self._has_humans:
+            await self._broadcast(msg_auction_result(
+                winner_index=result.winner_index,
+                winner_name=winner.name,
+                price=result.price,
+                card=card_info,
+                players=self._public_players(),
+            ))
 
-        await asyncio.sleep(2.0)
+        await self._ui_pause()
         await self._advance_turn()
 
+    async def _ui_pause(self) -> None:
+        """Give clients time to show the last result (skipped if AI-only)."""
+        if self._has_humans and self.ui_pace_seconds > 0:
+            await asyncio.sleep(self.ui_pace_seconds)
+
     async def _advance_turn(self) -> None:
         """Move to the next player's turn."""
-        log.debug("[ADVANCE] from %s", self._pname(self.current_turn))
-        has_cards = any(len(p.hand) > 0 for p in self.players)
-        if not has_cards:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[ADVANCE] from %s", self._pname(self.current_turn))
+        if not self._active_count:
             await self._end_round()
             return
 
-        for i in range(1, self.num_players + 1):
-            next_idx = (self.current_turn + i) % self.num_players
-            if len(self.players[next_idx].hand) > 0:
-                self.current_turn = next_idx
-                break
+        next_idx = self._next_active[self.current_turn]
+        while not self.players[next_idx].hand:
+            next_idx = self._next_active[next_idx]
+        self.current_turn = next_idx
 
         await self._broadcast(msg_turn_changed(self.current_turn))
         await self._send(self.players[self.current_turn],
@@ -716,56 +830,126 @@ class Game:
         # Trigger AI turn if needed
         await self._trigger_ai_turn_if_needed()
 
-    def _check_round_end(self, artist: str) -> bool:
-        return self.board[artist] >= ROUND_END_CARD_COUNT
+    def _public_players(self) -> List[Dict]:
+        """Public info for every player, rebuilt only after a state change."""
+        if self._public_cache is None:
+            self._public_cache = [p.to_public_dict() for p in self.players]
+        return self._public_cache
+
+    def _hand_pop(self, player_index: int, card_index: int) -> Card:
+        """Take a card out of a hand, keeping the state derived from hands
+        (artist counts, public info, turn ring) in step."""
+        player = self.players[player_index]
+        card = player.hand.pop(card_index)
+        player.artist_counts[card.artist_id] -= 1
+        self._public_cache = None
+        self._unlink_if_out_of_cards(player_index)
+        return card
+
+    def _hands_dealt(self) -> None:
+        """Rebuild the state derived from hands after a deal."""
+        for player in self.players:
+            player.count_artists()
+        self._public_cache = None
+        self._link_active_players()
+
+    def _link_active_players(self) -> None:
+        """Rebuild the ring of players with cards after a deal.
+
+        Players without cards are not in the ring, but still point at the
+        next player that has some.
+        """
+        n = self.num_players
+        active = [i for i in range(n) if self.players[i].hand]
+        self._next_active = [0] * n
+        self._prev_active = [0] * n
+        self._active_count = len(active)
+        if not active:
+            return
+        following = active[0]
+        for i in range(n - 1, -1, -1):
+            self._next_active[i] = following
+            if self.players[i].hand:
+                following = i
+        for k, i in enumerate(active):
+            self._prev_active[i] = active[k - 1]
+
+    def _unlink_if_out_of_cards(self, player_index: int) -> None:
+        """Drop a player from the turn ring once their hand is empty."""
+        if self.players[player_index].hand:
+            return
+        nxt = self._next_active[player_index]
+        prv = self._prev_active[player_index]
+        self._next_active[prv] = nxt
+        self._prev_active[nxt] = prv
+        self._active_count -= 1
+
+    def _check_round_end(self, artist_id: int) -> bool:
+        return self.board[artist_id] >= ROUND_END_CARD_COUNT
+
+    def _place_on_board(self, artist_id: int) -> None:
+        """Add one card of the given artist to the board."""
+        self.board[artist_id] += 1
+
+    def _place_double(self, artist_id: int) -> bool:
+        """Place both cards of a double; True if the round is over.
+
+        If the first card already ends the round the second one is not
+        placed, same as placing them one at a time with a check between.
+        """
+        board = self.board
+        board[artist_id] += 1 if board[artist_id] + 1 >= ROUND_END_CARD_COUNT else 2
+        return board[artist_id] >= ROUND_END_CARD_COUNT
 
     async def _end_round(self) -> None:
         """End the current round, calculate scores, and start next round."""
-        log.info("=== ROUND %d END === board=%s", self.round_num, dict(self.board))
+        if log.isEnabledFor(logging.INFO):
+            log.info("=== ROUND %d END === board=%s", self.round_num,
+                     _by_artist(self.board))
         self.round_active = False
 
-        round_values = calculate_round_values(self.board)
-
-        for artist in ARTISTS:
-            self.market[artist] += round_values[artist]
+        values = round_values_from_counts(self.board)
+        for i, value in enumerate(values):
+            self.market[i] += value
+        round_values = _by_artist(values)
 
         earnings = {}
         for i, player in enumerate(self.players):
-            player_earnings = 0
-            for painting in player.paintings:
-                artist = painting.get("artist", painting.get("artist", ""))
-                value = self.market.get(artist, 0)
-                player_earnings += value
+            player_earnings = sum(map(operator.mul, player.painting_counts,
+                                      self.market))
             player.money += player_earnings
             earnings[player.name] = player_earnings
-            player.paintings = []
+            player.clear_paintings()
+        self._public_cache = None
 
         self.round_num += 1
         if self.round_num > MAX_ROUNDS:
             await self._end_game(round_values, earnings)
             return
 
-        for artist in ARTISTS:
-            self.board[artist] = 0
+        for i in range(len(self.board)):
+            self.board[i] = 0
 
-        new_hands = deal_cards(self.deck, self.num_players, self.round_num)
-        for i, player in enumerate(self.players):
-            player.hand.extend(new_hands[i])
+        deal_cards(self.deck, self.num_players, self.round_num,
+                   [player.hand for player in self.players])
+        self._hands_dealt()
 
-        for i, player in enumerate(self.players):
-            await self._send(player, msg_round_ended(
-                round_values=round_values,
-                market=self.market,
-                players=[p.to_public_dict() for p in self.players],
-                earnings=earnings,
-                next_round=self.round_num,
-                new_hand=[c.to_dict() for c in player.hand],
-            ))
+        market = _by_artist(self.market)
+        for player in self.players:
+            if player.ws is not None:
+                player.send(msg_round_ended(
+                    round_values=round_values,
+                    market=market,
+                    players=self._public_players(),
+                    earnings=earnings,
+                    next_round=self.round_num,
+                    new_hand=[c.to_dict() for c in player.hand],
+                ))
 
         self.round_active = True
         self.current_turn = 0
 
-        await asyncio.sleep(2.0)
+        await self._ui_pause()
         await self._broadcast(msg_turn_changed(self.current_turn))
         await self._send(self.players[self.current_turn],
                          msg_your_turn(self.current_turn))
@@ -773,42 +957,104 @@ class Game:
         await self._trigger_ai_turn_if_needed()
 
     async def _end_game(self, last_round_values: dict, last_earnings: dict) -> None:
-        log.info("=== GAME END === scores=%s",
-                 {self._pname(i): p.money for i, p in enumerate(self.players)})
+        if log.isEnabledFor(logging.INFO):
+            log.info("=== GAME END === scores=%s",
+                     {self._pname(i): p.money for i, p in enumerate(self.players)})
         self.game_over = True
 
         winner_index = max(range(self.num_players),
                           key=lambda i: self.players[i].money)
 
-        for i, player in enumerate(self.players):
-            await self._send(player, msg_round_ended(
-                round_values=last_round_values,
-                market=self.market,
-                players=[p.to_public_dict() for p in self.players],
-                earnings=last_earnings,
-                next_round=self.round_num,
-            ))
+        await self._broadcast(msg_round_ended(
+            round_values=last_round_values,
+            market=_by_artist(self.market),
+            players=self._public_players(),
+            earnings=last_earnings,
+            next_round=self.round_num,
+        ))
 
-        await asyncio.sleep(2.0)
+        await self._ui_pause()
 
         await self._broadcast(msg_game_ended(
-            players=[p.to_public_dict() for p in self.players],
+            players=self._public_players(),
             winner_index=winner_index,
             winner_name=self.players[winner_index].name,
         ))
 
     async def _broadcast(self, message: str) -> None:
+        """Queue the same message for every human player."""
         for player in self.players:
-            await self._send(player, message)
+            player.send(message)
+
+    def _everyone_mask(self) -> int:
+        return (1 << self.num_players) - 1
+
+    async def _send_by_can_act(self, build: Callable[..., str],
+                               can_act_mask: int,
+                               changed_only: bool = False) -> None:
+        """Send build(can_act=bit i of can_act_mask) to each player i.
+
+        Messages differ only in can_act, so each variant is serialized
+        once and the same frame goes to every player that shares it.
+        With changed_only, players whose can_act is the same as in the
+        last such frame get nothing. Nothing is built in AI-only games.
+        """
+        if not self._has_humans:
+            return
+        frames = (build(can_act=False), build(can_act=True))
+        changed = can_act_mask ^ self._can_act_sent
+        self._can_act_sent = can_act_mask
+        for i, player in enumerate(self.players):
+            if changed_only and not (changed >> i) & 1:
+                continue
+            player.send(frames[(can_act_mask >> i) & 1])
+
+    async def _send_bid_update(self, auction: Auction, player_index: int,
+                               amount: int, can_act_mask: int) -> None:
+        """Send bid_update for a bid (amount 0 for a pass).
+
+        AI actions on the auction _trigger_ai_open_auction is running are
+        held instead; the pass ends with one update carrying the final
+        can_act flags and, if anyone bid, the last bid.
+        """
+        if auction is self._coalesced_auction:
+            if self._is_ai(player_index):
+                held = self._held_bid_update
+                if not amount and held is not None and held[1]:
+                    # A pass only changes can_act; keep showing the bid
+                    player_index, amount = held[0], held[1]
+                self._held_bid_update = (player_index, amount, can_act_mask)
+                return
+            self._held_bid_update = None  # Superseded by this update
+        await self._emit_bid_update(player_index, amount, can_act_mask)
+
+    async def _flush_bid_update(self) -> None:
+        """Send the bid_update held during an AI pass, if any."""
+        held, self._held_bid_update = self._held_bid_update, None
+        auction = self._coalesced_auction
+        if (held is None or self.current_auction is not auction
+                or auction.state == AuctionState.RESOLVED):
+            return
+        await self._emit_bid_update(*held)
+
+    async def _emit_bid_update(self, player_index: int, amount: int,
+                               can_act_mask: int) -> None:
+        """Fan out one bid_update.
+
+        A bid (amount > 0) goes to everyone. A pass (amount 0) only
+        refreshes can_act on the client, so it goes just to the players
+        whose can_act changed.
+        """
+        await self._send_by_can_act(functools.partial(
+            msg_bid_update,
+            player_index=player_index,
+            player_name=self.players[player_index].name,
+            amount=amount,
+        ), can_act_mask, changed_only=not amount)
 
     async def _send(self, player: Player, message: str) -> None:
         """Send a message to a player. Skip AI players (no WebSocket)."""
-        if player.is_ai:
-            return  # AI players don't have WebSocket connections
-        try:
-            await player.ws.send_str(message)
-        except Exception:
-            pass
+        player.send(message)
 
     async def _send_error(self, player: Player, message: str) -> None:
         await self._send(player, msg_error(message))
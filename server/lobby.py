@@ -1,9 +1,9 @@
 """Lobby management for room creation, joining, and player management."""
 
-import uuid
+import secrets
 import asyncio
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from game import Game, Player
 from ai_player import AIPlayerController
 from protocol import *
@@ -17,6 +17,35 @@ class Room:
     game: Optional[Game] = None
     started: bool = False
     ai_controller: Optional[AIPlayerController] = None
+    # Public player dicts for lobby messages (see public_players)
+    _players_snapshot: Optional[List[Dict]] = field(
+        default=None, init=False, repr=False, compare=False)
+    # Human (non-AI) players in seat order (see humans)
+    _humans: Optional[List[Player]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def public_players(self) -> List[Dict]:
+        """Public dicts of room.players, built once per roster change.
+
+        Anything that changes room.players must call roster_changed.
+        """
+        if self._players_snapshot is None:
+            self._players_snapshot = [p.to_public_dict() for p in self.players]
+        return self._players_snapshot
+
+    def humans(self) -> List[Player]:
+        """Human players of room.players, in order, built once per roster
+        change (same invalidation as public_players)."""
+        if self._humans is None:
+            self._humans = [p for p in self.players if not p.is_ai]
+        return self._humans
+
+    def has_ai(self) -> bool:
+        return len(self.humans()) != len(self.players)
+
+    def roster_changed(self) -> None:
+        self._players_snapshot = None
+        self._humans = None
 
     def to_dict(self) -> Dict:
         return {
@@ -27,58 +56,89 @@ class Room:
         }
 
 
+def _clean(data: dict, key: str) -> str:
+    """data[key] stripped, or "" if it is missing or not a string."""
+    value = data.get(key)
+    return value.strip() if isinstance(value, str) else ""
+
+
+# Game message type -> action(game, player_index, data)
+GAME_ACTIONS: Dict[str, Callable[[Game, int, dict], Awaitable[None]]] = {
+    "play_card": lambda game, i, data: game.handle_play_card(
+        i, data.get("card_index", -1), data.get("double_card_index", -1)),
+    "bid": lambda game, i, data: game.handle_bid(i, data.get("amount", 0)),
+    "pass": lambda game, i, data: game.handle_pass(i),
+    "accept": lambda game, i, data: game.handle_accept(i),
+    "set_price": lambda game, i, data: game.handle_set_price(
+        i, data.get("amount", 0)),
+    "double_response": lambda game, i, data: game.handle_double_response(
+        i, data.get("card_index", -1)),
+}
+
+
 class Lobby:
     """Manages game rooms and player connections."""
 
     def __init__(self):
         self.rooms: Dict[str, Room] = {}
-        self.player_room: Dict[str, str] = {}  # player_id -> room_id
-        self.ws_to_player: Dict[object, str] = {}  # ws -> player_id
+        # ws -> (room, player, index). index is the player's seat in
+        # room.players, and stays the game's player index once started
+        self.connections: Dict[object, Tuple[Room, Player, int]] = {}
+        # Encoded room_list reply, None until rebuilt (see _rooms_changed)
+        self._room_list: Optional[str] = None
+
+        # Message type -> handler(ws, data)
+        self._handlers: Dict[str, Callable[[object, dict], Awaitable[None]]] = {
+            "create_room": self._handle_create_room,
+            "join_room": self._handle_join_room,
+            "list_rooms": self._handle_list_rooms,
+            "start_game": self._handle_start_game,
+            "add_ai": self._handle_add_ai,
+            "remove_ai": self._handle_remove_ai,
+        }
+        for msg_type in GAME_ACTIONS:
+            self._handlers[msg_type] = self._handle_game_action
 
     def _generate_room_id(self) -> str:
-        return uuid.uuid4().hex[:6].upper()
+        return secrets.token_hex(3).upper()
 
     def _generate_player_id(self) -> str:
-        return uuid.uuid4().hex[:8]
+        return secrets.token_hex(4)
 
-    def get_room_by_player(self, player_id: str) -> Optional[Room]:
-        room_id = self.player_room.get(player_id)
-        if room_id:
-            return self.rooms.get(room_id)
-        return None
+    def _rooms_changed(self) -> None:
+        """Drop the cached room_list after a room is created or started,
+        or its roster changes."""
+        self._room_list = None
 
-    def get_player_index(self, room: Room, player_id: str) -> int:
+    def _roster_changed(self, room: Room) -> None:
+        room.roster_changed()
+        self._rooms_changed()
+
+    def _reindex(self, room: Room) -> None:
+        """Refresh the connection index of every human in room.
+
+        Call after room.players changes before the game starts; after that
+        the game keeps its own player list, so indices must not move.
+        """
+        connections = self.connections
         for i, p in enumerate(room.players):
-            if p.player_id == player_id:
-                return i
-        return -1
+            if p.ws is not None:
+                connections[p.ws] = (room, p, i)
 
     async def handle_message(self, ws, data: dict) -> None:
         """Route incoming WebSocket messages to appropriate handlers."""
         msg_type = data.get("type", "")
 
-        if msg_type == "create_room":
-            await self._handle_create_room(ws, data)
-        elif msg_type == "join_room":
-            await self._handle_join_room(ws, data)
-        elif msg_type == "list_rooms":
-            await self._handle_list_rooms(ws)
-        elif msg_type == "start_game":
-            await self._handle_start_game(ws)
-        elif msg_type == "add_ai":
-            await self._handle_add_ai(ws, data)
-        elif msg_type == "remove_ai":
-            await self._handle_remove_ai(ws, data)
-        elif msg_type in ("play_card", "bid", "pass", "accept", "set_price",
-                          "double_response"):
-            await self._handle_game_action(ws, data)
-        else:
-            await ws.send_str(msg_error(f"Unknown message type: {msg_type}"))
+        handler = self._handlers.get(msg_type)
+        if handler is None:
+            await self._reply(ws, msg_error(f"Unknown message type: {msg_type}"))
+            return
+        await handler(ws, data)
 
     async def _handle_create_room(self, ws, data: dict) -> None:
-        player_name = data.get("player_name", "").strip()
+        player_name = _clean(data, "player_name")
         if not player_name:
-            await ws.send_str(msg_error("Player name is required"))
+            await self._reply(ws, ERR_NAME_REQUIRED)
             return
 
         player_id = self._generate_player_id()
@@ -93,49 +153,48 @@ class Lobby:
         )
 
         self.rooms[room_id] = room
-        self.player_room[player_id] = room_id
-        self.ws_to_player[ws] = player_id
+        self._rooms_changed()
+        self.connections[ws] = (room, player, 0)
 
-        players_list = [p.to_public_dict() for p in room.players]
-        await ws.send_str(msg_room_created(room_id, player_id, players_list))
+        players_list = room.public_players()
+        player.send(msg_room_created(room_id, player_id, players_list))
 
     async def _handle_join_room(self, ws, data: dict) -> None:
-        player_name = data.get("player_name", "").strip()
-        room_id = data.get("room_id", "").strip().upper()
+        player_name = _clean(data, "player_name")
+        room_id = _clean(data, "room_id").upper()
 
         if not player_name:
-            await ws.send_str(msg_error("Player name is required"))
+            await self._reply(ws, ERR_NAME_REQUIRED)
             return
 
         room = self.rooms.get(room_id)
         if not room:
-            await ws.send_str(msg_error("Room not found"))
+            await self._reply(ws, ERR_ROOM_NOT_FOUND)
             return
 
         if room.started:
-            await ws.send_str(msg_error("Game already started"))
+            await self._reply(ws, ERR_GAME_STARTED)
             return
 
         if len(room.players) >= 5:
-            await ws.send_str(msg_error("Room is full (max 5 players)"))
+            await self._reply(ws, ERR_ROOM_FULL)
             return
 
         player_id = self._generate_player_id()
         player = Player(player_id=player_id, name=player_name, ws=ws)
 
         room.players.append(player)
-        self.player_room[player_id] = room_id
-        self.ws_to_player[ws] = player_id
+        self._roster_changed(room)
+        self.connections[ws] = (room, player, len(room.players) - 1)
 
-        players_list = [p.to_public_dict() for p in room.players]
+        players_list = room.public_players()
 
-        await ws.send_str(msg_room_joined(room_id, player_id, players_list))
+        player.send(msg_room_joined(room_id, player_id, players_list))
 
+        joined = msg_player_joined(players_list, player_name)
         for p in room.players:
-            if p.player_id != player_id:
-                await self._send_safe(p.ws, msg_player_joined(
-                    players_list, player_name
-                ))
+            if p is not player:
+                p.send(joined)
 
     def _add_ai_player(self, room: Room) -> str:
         """Add an AI player to the room and return its name."""
@@ -152,61 +211,60 @@ class Lobby:
             is_ai=True,
         )
         room.players.append(ai_player)
+        self._roster_changed(room)
         return ai_name
 
     async def _handle_add_ai(self, ws, data: dict) -> None:
         """Add an AI player to the room."""
-        player_id = self.ws_to_player.get(ws)
-        if not player_id:
-            await ws.send_str(msg_error("Not in a room"))
+        ctx = self.connections.get(ws)
+        if not ctx:
+            await self._reply(ws, ERR_NOT_IN_ROOM)
             return
 
-        room = self.get_room_by_player(player_id)
-        if not room:
-            await ws.send_str(msg_error("Room not found"))
+        room, player, _ = ctx
+        player_id = player.player_id
+        if self.rooms.get(room.room_id) is not room:
+            await self._reply(ws, ERR_ROOM_NOT_FOUND)
             return
 
         if room.host_id != player_id:
-            await ws.send_str(msg_error("Only the host can add AI"))
+            await self._reply(ws, ERR_HOST_ONLY_ADD_AI)
             return
 
         if room.started:
-            await ws.send_str(msg_error("Game already started"))
+            await self._reply(ws, ERR_GAME_STARTED)
             return
 
         if len(room.players) >= 5:
-            await ws.send_str(msg_error("Room is full (max 5 players)"))
+            await self._reply(ws, ERR_ROOM_FULL)
             return
 
         ai_name = self._add_ai_player(room)
 
-        players_list = [p.to_public_dict() for p in room.players]
-
         # Notify all human players
-        for p in room.players:
-            if not p.is_ai:
-                await self._send_safe(p.ws, msg_player_joined(
-                    players_list, ai_name
-                ))
+        joined = msg_player_joined(room.public_players(), ai_name)
+        for p in room.humans():
+            p.send(joined)
 
     async def _handle_remove_ai(self, ws, data: dict) -> None:
         """Remove an AI player from the room."""
-        player_id = self.ws_to_player.get(ws)
-        if not player_id:
-            await ws.send_str(msg_error("Not in a room"))
+        ctx = self.connections.get(ws)
+        if not ctx:
+            await self._reply(ws, ERR_NOT_IN_ROOM)
             return
 
-        room = self.get_room_by_player(player_id)
-        if not room:
-            await ws.send_str(msg_error("Room not found"))
+        room, player, _ = ctx
+        player_id = player.player_id
+        if self.rooms.get(room.room_id) is not room:
+            await self._reply(ws, ERR_ROOM_NOT_FOUND)
             return
 
         if room.host_id != player_id:
-            await ws.send_str(msg_error("Only the host can remove AI"))
+            await self._reply(ws, ERR_HOST_ONLY_REMOVE_AI)
             return
 
         if room.started:
-            await ws.send_str(msg_error("Game already started"))
+            await self._reply(ws, ERR_GAME_STARTED)
             return
 
         # Find and remove the last AI player
@@ -219,135 +277,116 @@ class Lobby:
                 break
 
         if ai_index < 0:
-            await ws.send_str(msg_error("No AI players to remove"))
+            await self._reply(ws, ERR_NO_AI_TO_REMOVE)
             return
 
         room.players.pop(ai_index)
-        players_list = [p.to_public_dict() for p in room.players]
+        self._roster_changed(room)
+        self._reindex(room)
 
         # Notify all human players
-        for p in room.players:
-            if not p.is_ai:
-                await self._send_safe(p.ws, msg_player_left(
-                    players_list, ai_name
-                ))
-
-    async def _handle_list_rooms(self, ws) -> None:
-        rooms_list = [
-            room.to_dict() for room in self.rooms.values()
-            if not room.started and len(room.players) < 5
-        ]
-        await ws.send_str(msg_room_list(rooms_list))
-
-    async def _handle_start_game(self, ws) -> None:
-        player_id = self.ws_to_player.get(ws)
-        if not player_id:
-            await ws.send_str(msg_error("Not in a room"))
+        left = msg_player_left(room.public_players(), ai_name)
+        for p in room.humans():
+            p.send(left)
+
+    async def _handle_list_rooms(self, ws, data: dict) -> None:
+        if self._room_list is None:
+            rooms_list = [
+                room.to_dict() for room in self.rooms.values()
+                if not room.started and len(room.players) < 5
+            ]
+            self._room_list = msg_room_list(rooms_list)
+        await self._reply(ws, self._room_list)
+
+    async def _handle_start_game(self, ws, data: dict) -> None:
+        ctx = self.connections.get(ws)
+        if not ctx:
+            await self._reply(ws, ERR_NOT_IN_ROOM)
             return
 
-        room = self.get_room_by_player(player_id)
-        if not room:
-            await ws.send_str(msg_error("Room not found"))
+        room, player, _ = ctx
+        player_id = player.player_id
+        if self.rooms.get(room.room_id) is not room:
+            await self._reply(ws, ERR_ROOM_NOT_FOUND)
             return
 
         if room.host_id != player_id:
-            await ws.send_str(msg_error("Only the host can start the game"))
+            await self._reply(ws, ERR_HOST_ONLY_START)
             return
 
         if len(room.players) < 3:
-            await ws.send_str(msg_error("Need at least 3 players"))
+            await self._reply(ws, ERR_NEED_3_PLAYERS)
             return
 
         if room.started:
-            await ws.send_str(msg_error("Game already started"))
+            await self._reply(ws, ERR_GAME_STARTED)
             return
 
         # Check if there are any AI players
-        has_ai = any(p.is_ai for p in room.players)
-        ai_ctrl = room.ai_controller if has_ai else None
+        ai_ctrl = room.ai_controller if room.has_ai() else None
 
         room.started = True
+        self._rooms_changed()
         room.game = Game(room.players, ai_controller=ai_ctrl)
         await room.game.start()
 
     async def _handle_game_action(self, ws, data: dict) -> None:
-        player_id = self.ws_to_player.get(ws)
-        if not player_id:
+        ctx = self.connections.get(ws)
+        if not ctx:
             return
 
-        room = self.get_room_by_player(player_id)
-        if not room or not room.game:
+        room, _, player_index = ctx
+        game = room.game
+        if not game:
             return
 
-        player_index = self.get_player_index(room, player_id)
-        if player_index < 0:
-            return
+        await GAME_ACTIONS[data.get("type", "")](game, player_index, data)
 
-        game = room.game
-        msg_type = data.get("type", "")
+    async def _reply(self, ws, message: str) -> None:
+        """Send a frame back to the client on ws.
 
-        if msg_type == "play_card":
-            card_index = data.get("card_index", -1)
-            double_card_index = data.get("double_card_index", -1)
-            await game.handle_play_card(player_index, card_index, double_card_index)
-        elif msg_type == "bid":
-            amount = data.get("amount", 0)
-            await game.handle_bid(player_index, amount)
-        elif msg_type == "pass":
-            await game.handle_pass(player_index)
-        elif msg_type == "accept":
-            await game.handle_accept(player_index)
-        elif msg_type == "set_price":
-            amount = data.get("amount", 0)
-            await game.handle_set_price(player_index, amount)
-        elif msg_type == "double_response":
-            second_card_index = data.get("card_index", -1)
-            await game.handle_double_response(player_index, second_card_index)
+        Seated players get it through their send queue, so it stays in
+        order with room and game broadcasts already queued for them.
+        """
+        ctx = self.connections.get(ws)
+        if ctx:
+            ctx[1].send(message)
+            return
+        try:
+            await ws.send_str(message)
+        except Exception:
+            pass
 
     async def handle_disconnect(self, ws) -> None:
         """Handle a player disconnecting."""
-        player_id = self.ws_to_player.pop(ws, None)
-        if not player_id:
+        ctx = self.connections.pop(ws, None)
+        if not ctx:
             return
 
-        room_id = self.player_room.pop(player_id, None)
-        if not room_id:
+        room, player, _ = ctx
+        player_id = player.player_id
+        room_id = room.room_id
+        if self.rooms.get(room_id) is not room:
             return
 
-        room = self.rooms.get(room_id)
-        if not room:
-            return
+        player_name = player.name
+        player.stop_sending()
 
-        player_name = "Unknown"
-        for p in room.players:
-            if p.player_id == player_id:
-                player_name = p.name
-                break
-
-        room.players = [p for p in room.players if p.player_id != player_id]
+        room.players = [p for p in room.players if p is not player]
+        self._roster_changed(room)
+        if not room.started:
+            self._reindex(room)
 
         # If no human players left, remove room
-        human_players = [p for p in room.players if not p.is_ai]
+        human_players = room.humans()
         if not human_players:
             del self.rooms[room_id]
             return
 
         if room.host_id == player_id:
             # Assign new host to first human player
-            for p in room.players:
-                if not p.is_ai:
-                    room.host_id = p.player_id
-                    break
-
-        players_list = [p.to_public_dict() for p in room.players]
-        for p in room.players:
-            if not p.is_ai:
-                await self._send_safe(p.ws, msg_player_left(players_list, player_name))
+            room.host_id = human_players[0].player_id
 
-    async def _send_safe(self, ws, message: str) -> None:
-        if ws is None:
-            return  # AI player
-        try:
-            await ws.send_str(message)
-        except Exception:
-            pass
+        left = msg_player_left(room.public_players(), player_name)
+        for p in human_players:
+            p.send(left)
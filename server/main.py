@@ -3,8 +3,13 @@
 import os
 import asyncio
 import argparse
+import atexit
 import logging
+import logging.handlers
+import mimetypes
+import queue
 from pathlib import Path
+from types import MappingProxyType
 
 from aiohttp import web
 import aiohttp
@@ -16,28 +21,72 @@ from protocol import parse_message
 LOG_DIR = os.path.dirname(__file__)
 LOG_FILE = os.path.join(LOG_DIR, "server.log")
 
+LOG_FLUSH_RECORDS = 1024   # file writes are batched up to this many records
+LOG_FLUSH_SECONDS = 2.0    # ...or this long, whichever comes first
+
+# Records are formatted on the caller's thread and written to the file and
+# console by a listener thread, so logging never blocks the event loop.
+# The file side is buffered; errors and above are written at once.
+_log_file = logging.handlers.MemoryHandler(
+    capacity=LOG_FLUSH_RECORDS,
+    flushLevel=logging.ERROR,
+    target=logging.FileHandler(LOG_FILE, encoding="utf-8", mode="w"),
+)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    _log_file,
+    logging.StreamHandler(),
+)
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s [%(name)-6s] %(levelname)-5s %(message)s",
     datefmt="%H:%M:%S",
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding="utf-8", mode="w"),
-        logging.StreamHandler(),
-    ],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener.start()
+# Drains the queue; logging's own exit hook then flushes _log_file
+atexit.register(_log_listener.stop)
 # Suppress noisy aiohttp access logs
 logging.getLogger("aiohttp").setLevel(logging.WARNING)
 logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
 
 log = logging.getLogger("server")
 
+# Rooms, games and their sockets all live in this process, so the server
+# runs as a single process: a second process on the same port would have
+# its own, disjoint set of rooms. Scale up a core (uvloop, --loop) rather
+# than out.
 lobby = Lobby()
 
+# Transport write buffer watermarks for game sockets. Above asyncio's 64 KiB
+# default so a burst of broadcasts (round end, state sync) doesn't pause
+# the writer; frames are small, so this trades a little memory per slow
+# client for not waiting on drain(). aiohttp already sets TCP_NODELAY, which
+# is what we want for small, latency-bound turn messages.
+WS_WRITE_BUFFER_HIGH = 256 * 1024
+WS_WRITE_BUFFER_LOW = 64 * 1024
+
+# Headers for every static response: COOP/COEP enable SharedArrayBuffer
+# for the Godot web export
+STATIC_HEADERS = MappingProxyType({
+    "Cross-Origin-Opener-Policy": "same-origin",
+    "Cross-Origin-Embedder-Policy": "require-corp",
+    "Cache-Control": "no-cache, must-revalidate",
+})
+
+# Not in every platform's mime table, and browsers need it for streaming
+# compilation
+mimetypes.add_type("application/wasm", ".wasm")
+
 
 async def websocket_handler(request: web.Request) -> web.WebSocketResponse:
     """Handle WebSocket connections for game communication."""
     ws = web.WebSocketResponse()
     await ws.prepare(request)
+    if request.transport is not None:
+        request.transport.set_write_buffer_limits(
+            high=WS_WRITE_BUFFER_HIGH, low=WS_WRITE_BUFFER_LOW)
 
     log.info("Client connected: %s", request.remote)
 
@@ -57,6 +106,32 @@ async def websocket_handler(request: web.Request) -> web.WebSocketResponse:
     return ws
 
 
+async def _flush_log_file(app: web.Application):
+    """cleanup_ctx: flush the buffered log file every LOG_FLUSH_SECONDS."""
+    async def flush_periodically():
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(LOG_FLUSH_SECONDS)
+            await loop.run_in_executor(None, _log_file.flush)
+
+    task = asyncio.get_running_loop().create_task(flush_periodically())
+    yield
+    task.cancel()
+
+
+@web.middleware
+async def static_headers_middleware(request: web.Request, handler):
+    """Add STATIC_HEADERS to every response not already sent.
+
+    WebSocket responses are prepared by their handler before it returns,
+    so they are left alone.
+    """
+    response = await handler(request)
+    if not response.prepared:
+        response.headers.update(STATIC_HEADERS)
+    return response
+
+
 def create_app(static_dir: str = None) -> web.Application:
     """Create the aiohttp application."""
     app = web.Application()
@@ -66,44 +141,23 @@ def create_app(static_dir: str = None) -> web.Application:
 
     # Static file serving (Godot web export)
     if static_dir and os.path.isdir(static_dir):
+        app.middlewares.append(static_headers_middleware)
+
         # Serve index.html at root
-        async def index_handler(request: web.Request) -> web.FileResponse:
-            index_path = os.path.join(static_dir, "index.html")
+        index_path = os.path.join(static_dir, "index.html")
+
+        async def index_handler(request: web.Request) -> web.StreamResponse:
             if os.path.exists(index_path):
-                headers = {
-                    "Cross-Origin-Opener-Policy": "same-origin",
-                    "Cross-Origin-Embedder-Policy": "require-corp",
-                    "Cache-Control": "no-cache, must-revalidate",
-                }
-                return web.FileResponse(index_path, headers=headers)
+                return web.FileResponse(index_path)
             return web.Response(text="Modern Art Server Running", status=200)
 
         app.router.add_get("/", index_handler)
 
-        # Serve all static files with required headers for SharedArrayBuffer
-        async def static_handler(request: web.Request) -> web.Response:
-            file_path = os.path.join(static_dir, request.match_info["path"])
-            if os.path.isfile(file_path):
-                headers = {
-                    "Cross-Origin-Opener-Policy": "same-origin",
-                    "Cross-Origin-Embedder-Policy": "require-corp",
-                    "Cache-Control": "no-cache, must-revalidate",
-                }
-                # Set correct content types
-                if file_path.endswith(".wasm"):
-                    headers["Content-Type"] = "application/wasm"
-                elif file_path.endswith(".js"):
-                    headers["Content-Type"] = "application/javascript"
-                elif file_path.endswith(".html"):
-                    headers["Content-Type"] = "text/html"
-                elif file_path.endswith(".png"):
-                    headers["Content-Type"] = "image/png"
-                elif file_path.endswith(".ico"):
-                    headers["Content-Type"] = "image/x-icon"
-                return web.FileResponse(file_path, headers=headers)
-            return web.Response(status=404)
-
-        app.router.add_get("/{path:.*}", static_handler)
+        # Everything else comes straight from the export directory;
+        # aiohttp's static resource handles content types, sendfile and
+        # paths escaping the directory
+        app.router.add_static("/", static_dir, show_index=False,
+                              append_version=False)
 
     else:
         async def default_handler(request: web.Request) -> web.Response:
@@ -116,6 +170,26 @@ def create_app(static_dir: str = None) -> web.Application:
     return app
 
 
+LOOP_CHOICES = ("auto", "asyncio", "uvloop")
+
+
+def _set_loop_policy(loop: str) -> str:
+    """Install the event loop policy for --loop and return the loop used.
+
+    "auto" picks uvloop when it is installed. run_app creates its loop
+    through the policy, so this must run before it. Other loops (e.g. an
+    io_uring one) plug in here the same way.
+    """
+    if loop == "asyncio":
+        return "asyncio"
+    try:
+        import uvloop
+    except ImportError:
+        return "asyncio"
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
+
+
 def main():
     parser = argparse.ArgumentParser(description="Modern Art Game Server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
@@ -126,6 +200,12 @@ def main():
                         help="Path to static files (Godot web export directory)")
     parser.add_argument("--no-static", action="store_true",
                         help="Disable static file serving (when behind Nginx)")
+    parser.add_argument("--loop", choices=LOOP_CHOICES, default="auto",
+                        help="Event loop to run on (auto: uvloop if installed)")
+    parser.add_argument("--reuse-port", action="store_true",
+                        help="Set SO_REUSEPORT, e.g. to start the new process "
+                             "before stopping the old one on restart (rooms "
+                             "are per process, so don't run several at once)")
     args = parser.parse_args()
 
     # Default static dir: ../export
@@ -142,9 +222,16 @@ def main():
     else:
         log.info("No static directory found. Only WebSocket available.")
 
+    loop = _set_loop_policy(args.loop)
+    if args.loop == "uvloop" and loop != "uvloop":
+        parser.error("--loop uvloop: uvloop is not installed")
+    log.info("Using %s event loop", loop)
+
     app = create_app(static_dir)
+    app.cleanup_ctx.append(_flush_log_file)
     log.info("Starting on http://%s:%d  (log file: %s)", args.host, args.port, LOG_FILE)
-    web.run_app(app, host=args.host, port=args.port)
+    web.run_app(app, host=args.host, port=args.port,
+                reuse_port=args.reuse_port or None)
 
 
 if __name__ == "__main__":
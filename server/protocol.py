@@ -3,19 +3,40 @@
 import json
 from typing import Any, Dict
 
+try:
+    import orjson  # optional, much faster encoder
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(data: Dict[str, Any]) -> str:
+        # Frames go out with send_str, so keep returning text
+        return orjson.dumps(data).decode()
+
+    _loads = orjson.loads
+else:
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def _dumps(data: Dict[str, Any]) -> str:
+        # Compact like orjson's output
+        return _encoder.encode(data)
+
+    _loads = json.loads
+
 
 def make_message(msg_type: str, **kwargs) -> str:
     """Create a JSON message string."""
     data = {"type": msg_type}
     data.update(kwargs)
-    return json.dumps(data, ensure_ascii=False)
+    return _dumps(data)
 
 
 def parse_message(text: str) -> Dict[str, Any]:
     """Parse a JSON message string."""
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return _loads(text)
+    except ValueError:  # json and orjson decode errors both subclass it
         return {"type": "error", "message": "Invalid JSON"}
 
 
@@ -24,6 +45,30 @@ def parse_message(text: str) -> Dict[str, Any]:
 def msg_error(message: str) -> str:
     return make_message("error", message=message)
 
+
+# Fixed error frames, encoded once at import
+# Lobby
+ERR_NAME_REQUIRED = msg_error("Player name is required")
+ERR_ROOM_NOT_FOUND = msg_error("Room not found")
+ERR_GAME_STARTED = msg_error("Game already started")
+ERR_ROOM_FULL = msg_error("Room is full (max 5 players)")
+ERR_NOT_IN_ROOM = msg_error("Not in a room")
+ERR_HOST_ONLY_ADD_AI = msg_error("Only the host can add AI")
+ERR_HOST_ONLY_REMOVE_AI = msg_error("Only the host can remove AI")
+ERR_NO_AI_TO_REMOVE = msg_error("No AI players to remove")
+ERR_HOST_ONLY_START = msg_error("Only the host can start the game")
+ERR_NEED_3_PLAYERS = msg_error("Need at least 3 players")
+# Game
+ERR_GAME_NOT_ACTIVE = msg_error("Game not active")
+ERR_AUCTION_IN_PROGRESS = msg_error("Auction in progress")
+ERR_NOT_YOUR_TURN = msg_error("Not your turn")
+ERR_INVALID_CARD_INDEX = msg_error("Invalid card index")
+ERR_INVALID_DOUBLE_CARD_INDEX = msg_error("Invalid double card index")
+ERR_DOUBLE_CARD_ARTIST = msg_error("Double card must be same artist")
+ERR_SAME_ARTIST_REQUIRED = msg_error("Same artist card required")
+ERR_NOT_ENOUGH_MONEY = msg_error("Not enough money")
+
+
 def msg_room_created(room_id: str, player_id: str, players: list = None) -> str:
     data = dict(room_id=room_id, player_id=player_id)
     if players: